@@ -0,0 +1,49 @@
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def cache_by_file(
+    maxsize: int = 32,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Cache the results of a function that loads data from a file.
+    The first argument of the decorated function must be the path to the file, all other arguments must be hashable.
+    Results are keyed on the resolved path, the modification time and the size of the file.
+    A file is therefore loaded again once it has been modified, and a relative path is never mixed up with another
+    file after the working directory has changed.
+    Arguments that don't point to a local file, e.g. URLs or file objects, are passed on without caching.
+    The cache can be emptied by calling `cache_clear` on the decorated function.
+
+    Args:
+        maxsize: maximum amount of results to keep, least recently used results are discarded first
+
+    Returns:
+        decorator for functions that load data from a file
+    """
+
+    def _decorator(load_fn: Callable[..., T]) -> Callable[..., T]:
+        @lru_cache(maxsize=maxsize)
+        def _load_cached(file_path: Path, _mtime_ns: int, _size: int, *args) -> T:
+            return load_fn(file_path, *args)
+
+        @wraps(load_fn)
+        def _load(file_path, *args) -> T:
+            try:
+                file_path = Path(file_path).resolve(strict=True)
+                file_stat = file_path.stat()
+            except (TypeError, OSError):
+                # not a local file, so there is nothing to key the cache on
+                return load_fn(file_path, *args)
+
+            return _load_cached(
+                file_path, file_stat.st_mtime_ns, file_stat.st_size, *args
+            )
+
+        _load.cache_clear = _load_cached.cache_clear
+
+        return _load
+
+    return _decorator
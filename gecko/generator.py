@@ -6,24 +6,92 @@ These generators wrap around common data sources such as frequency tables and nu
 __all__ = [
     "Generator",
     "from_function",
+    "from_vectorized_function",
     "from_uniform_distribution",
     "from_normal_distribution",
     "from_frequency_table",
     "from_multicolumn_frequency_table",
     "to_data_frame",
+    "clear_cache",
 ]
 
 from os import PathLike
-from typing import Callable, Optional, Union
+from typing import Callable, Iterable, Optional, Union
 
 import numpy as np
 import pandas as pd
 from typing_extensions import ParamSpec  # required for 3.9 backport
 
+from gecko._file_cache import cache_by_file
+
 P = ParamSpec("P")
 Generator = Callable[[int], list[pd.Series]]
 
 
+@cache_by_file()
+def _load_frequency_table(
+    csv_file_path: Union[str, PathLike[str]],
+    value_columns: Union[tuple[int, ...], tuple[str, ...]],
+    freq_column: Union[str, int],
+    encoding: str,
+    delimiter: str,
+) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    """
+    Read values and their relative frequencies from a frequency table. Results are cached, so the file is only
+    parsed once for each combination of arguments until it is modified. The returned arrays are read-only since
+    they are shared between all generators that are created from the same arguments.
+
+    Args:
+        csv_file_path: path to CSV file
+        value_columns: names or indices of the value columns
+        freq_column: name or index of the frequency column
+        encoding: character encoding of the CSV file
+        delimiter: column delimiter of the CSV file
+
+    Returns:
+        values of each value column and the relative frequency of each row
+    """
+    header = isinstance(freq_column, str)
+
+    # read csv file
+    df = pd.read_csv(
+        csv_file_path,
+        header=0 if header else None,  # header row index (`None` if not present)
+        usecols=[*value_columns, freq_column],
+        dtype={
+            freq_column: "int",
+            **{value_column: "str" for value_column in value_columns},
+        },
+        sep=delimiter,
+        encoding=encoding,
+    )
+
+    # values of each column and the relative frequency of each row
+    column_arrays = tuple(df[c].to_numpy(dtype=object) for c in value_columns)
+    arr_prob = (df[freq_column] / df[freq_column].sum()).to_numpy()
+
+    for arr in (*column_arrays, arr_prob):
+        arr.flags.writeable = False
+
+    return column_arrays, arr_prob
+
+
+def clear_cache():
+    """
+    Discard all frequency tables that have been read by `from_frequency_table` and
+    `from_multicolumn_frequency_table`.
+    Modified files are read again without clearing the cache, so this is only needed to free memory.
+    Generators that have already been created keep using the values they were created with.
+    """
+    _load_frequency_table.cache_clear()
+
+
+def _format_floats(format_str: str, arr: np.ndarray) -> pd.Series:
+    """Format an array of floats into a series of strings. Formatting plain Python floats skips the conversion
+    to a fixed-width string array that np.char.mod performs."""
+    return pd.Series([format_str % x for x in arr.tolist()], dtype=object)
+
+
 def from_function(func: Callable[P, str], *args: object, **kwargs: object) -> Generator:
     """
     Generate data from an arbitrary function that returns a single value at a time.
@@ -31,6 +99,7 @@ def from_function(func: Callable[P, str], *args: object, **kwargs: object) -> Ge
     Notes:
         This function should be used sparingly since it is not vectorized.
         Only use it for testing purposes or if performance is not important.
+        Use `from_vectorized_function` for functions that can generate many values at once.
 
     Args:
         func: function to invoke to generate data from
@@ -42,7 +111,33 @@ def from_function(func: Callable[P, str], *args: object, **kwargs: object) -> Ge
     """
 
     def _generate(count: int) -> list[pd.Series]:
-        return [pd.Series(data=[func(*args, **kwargs) for _ in np.arange(count)])]
+        return [pd.Series(data=[func(*args, **kwargs) for _ in range(count)])]
+
+    return _generate
+
+
+def from_vectorized_function(
+    func: Callable[P, Iterable[str]],
+    *args: object,
+    count_arg: str = "size",
+    **kwargs: object,
+) -> Generator:
+    """
+    Generate data from an arbitrary function that returns many values at once.
+    The amount of values to generate is passed to the function as a keyword argument.
+
+    Args:
+        func: function to invoke to generate data from
+        *args: positional arguments to pass to `func`
+        count_arg: name of the keyword argument of `func` that determines the amount of values to generate
+        **kwargs: keyword arguments to pass to `func`
+
+    Returns:
+        function returning list with strings generated from custom function
+    """
+
+    def _generate(count: int) -> list[pd.Series]:
+        return [pd.Series(data=func(*args, **{count_arg: count}, **kwargs))]
 
     return _generate
 
@@ -71,7 +166,7 @@ def from_uniform_distribution(
     format_str = f"%.{precision}f"
 
     def _generate(count: int) -> list[pd.Series]:
-        return [pd.Series(np.char.mod(format_str, rng.uniform(low, high, count)))]
+        return [_format_floats(format_str, rng.uniform(low, high, count))]
 
     return _generate
 
@@ -100,7 +195,7 @@ def from_normal_distribution(
     format_str = f"%.{precision}f"
 
     def _generate(count: int) -> list[pd.Series]:
-        return [pd.Series(np.char.mod(format_str, rng.normal(mean, sd, count)))]
+        return [_format_floats(format_str, rng.normal(mean, sd, count))]
 
     return _generate
 
@@ -144,24 +239,14 @@ def from_frequency_table(
             "value and frequency columns must be either a string or an integer"
         )
 
-    header = isinstance(freq_column, str)
-
-    # read csv file
-    df = pd.read_csv(
-        csv_file_path,
-        header=0 if header else None,  # header row index (`None` if not present)
-        usecols=[value_column, freq_column],
-        dtype={freq_column: "int", value_column: "str"},
-        sep=delimiter,
-        encoding=encoding,
+    (arr_value,), arr_prob = _load_frequency_table(
+        csv_file_path, (value_column,), freq_column, encoding, delimiter
     )
 
-    # convert absolute to relative frequencies
-    srs_value = df[value_column]
-    srs_prob = df[freq_column] / df[freq_column].sum()
-
     def _generate(count: int) -> list[pd.Series]:
-        return [pd.Series(rng.choice(srs_value, count, p=srs_prob))]
+        # draw indices instead of values to avoid converting the values on every call
+        arr_value_idx = rng.choice(len(arr_prob), count, p=arr_prob)
+        return [pd.Series(arr_value.take(arr_value_idx), copy=False)]
 
     return _generate
 
@@ -222,30 +307,14 @@ def from_multicolumn_frequency_table(
                 "value and frequency column must be either a string or an integer"
             )
 
-    header = isinstance(freq_column, str)
-
-    df = pd.read_csv(
-        csv_file_path,
-        header=0 if header else None,
-        usecols=value_columns + [freq_column],
-        dtype={
-            freq_column: "int",
-            **{value_column: "str" for value_column in value_columns},
-        },
-        sep=delimiter,
-        encoding=encoding,
+    column_arrays, arr_prob = _load_frequency_table(
+        csv_file_path, tuple(value_columns), freq_column, encoding, delimiter
     )
 
-    # sum of absolute frequencies
-    freq_total = df[freq_column].sum()
-    # new series to track the relative frequencies
-    value_tuple_list = list(zip(*[list(df[c]) for c in value_columns]))
-    rel_freq_list = list(df[freq_column] / freq_total)
-
-    # noinspection PyTypeChecker
     def _generate(count: int) -> list[pd.Series]:
-        x = rng.choice(value_tuple_list, count, p=rel_freq_list)
-        return [pd.Series(list(t)) for t in zip(*x)]  # dark magic
+        # draw row indices once and gather the values of each column with them
+        arr_row_idx = rng.choice(len(arr_prob), count, p=arr_prob)
+        return [pd.Series(arr.take(arr_row_idx), copy=False) for arr in column_arrays]
 
     return _generate
 
@@ -294,5 +363,11 @@ def to_data_frame(
         for i in range(len(gen_col_values)):
             col_to_srs_dict[gen_col_names[i]] = gen_col_values[i]
 
-    # finally create df from the list of named series
-    return pd.DataFrame(data=col_to_srs_dict)
+    # finally create df from the named series. concatenating them keeps their values in separate blocks
+    # instead of copying them into a single one.
+    return pd.concat(
+        col_to_srs_dict.values(),
+        axis=1,
+        keys=list(col_to_srs_dict.keys()),
+        copy=False,
+    )
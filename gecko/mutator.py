@@ -17,32 +17,44 @@ __all__ = [
     "with_noop",
     "with_categorical_values",
     "with_function",
+    "with_vectorized_function",
     "with_permute",
     "mutate_data_frame",
+    "clear_cache",
 ]
 
+import importlib.util
 import itertools
+import math
+import re
 import string
 from dataclasses import dataclass, field
 from os import PathLike
 from pathlib import Path
-from typing import Callable, Optional, Union, Literal, NamedTuple
+from typing import Callable, Iterable, Optional, Union, Literal, NamedTuple, Sequence
 
 import numpy as np
 import pandas as pd
 from lxml import etree
 from typing_extensions import ParamSpec, Concatenate
 
-from gecko.cldr import decode_iso_kb_pos, unescape_kb_char, get_neighbor_kb_pos_for
+from gecko._file_cache import cache_by_file
+from gecko.cldr import decode_iso_kb_pos, unescape_kb_char
 
 Mutator = Callable[[list[pd.Series]], list[pd.Series]]
-_EditOp = Literal["ins", "del", "sub", "trs"]
+
+# pyarrow is an optional dependency. if it is installed, substring checks are run on pyarrow-backed series.
+_has_pyarrow = importlib.util.find_spec("pyarrow") is not None
 
 
 class _PhoneticReplacementRule(NamedTuple):
     pattern: str
     replacement: str
     flags: str
+    # precompiled regexes for replacing the pattern at the start, end or in the middle of a string
+    regex_start: re.Pattern
+    regex_end: re.Pattern
+    regex_middle: re.Pattern
 
 
 def _check_probability_in_bounds(p: float):
@@ -50,6 +62,86 @@ def _check_probability_in_bounds(p: float):
         raise ValueError("probability is out of range, must be between 0 and 1")
 
 
+def _is_probability_sum_one(p_sum: float) -> bool:
+    """Check that a sum of probabilities is one while allowing for rounding errors. The tolerance is the same
+    that numpy uses when sampling with probabilities."""
+    return math.isclose(p_sum, 1.0, abs_tol=np.sqrt(np.finfo(float).eps))
+
+
+def _draw_indices(
+    rng: np.random.Generator, p_values: Sequence[float], size: int
+) -> np.ndarray:
+    """Draw random indices into a list of probabilities. If all probabilities are the same, indices are drawn
+    without going through weighted sampling."""
+    if np.allclose(p_values, 1 / len(p_values)):
+        return rng.integers(0, len(p_values), size=size)
+
+    return rng.choice(len(p_values), size=size, p=p_values)
+
+
+def _series_to_char_matrix(srs: pd.Series, padding: int = 0) -> np.ndarray:
+    """Convert a series of strings into a matrix with one row per string and one char per cell.
+    Strings that are shorter than the longest string are padded with empty chars. Additional empty
+    columns can be requested with `padding`. Missing values are laid out as empty strings."""
+    arr_str = srs.to_numpy(dtype=str, na_value="")
+    # each unicode char takes up four bytes
+    str_width = arr_str.itemsize // 4 + padding
+    arr_str = arr_str.astype(f"U{str_width}", copy=False)
+    return arr_str.view("U1").reshape(len(arr_str), str_width)
+
+
+def _to_arrow_str_series(srs: pd.Series) -> pd.Series:
+    """Convert a series of strings into a pyarrow-backed string series if pyarrow is installed. String methods
+    on such series run on compiled kernels instead of calling into Python for every string. Only use this for
+    checks that don't depend on char positions since pyarrow reports them in bytes, not chars."""
+    if not _has_pyarrow or srs.dtype == "string[pyarrow]":
+        return srs
+
+    return srs.astype("string[pyarrow]")
+
+
+def _new_series_like(arr_str: np.ndarray, srs: pd.Series) -> pd.Series:
+    """Wrap an array of strings into a series with the same index and name as another series. If the other
+    series is backed by one of pandas' string dtypes, then the new series is created with the same dtype.
+    Otherwise strings are stored as objects."""
+    dtype = srs.dtype if isinstance(srs.dtype, pd.StringDtype) else object
+    return pd.Series(arr_str, index=srs.index, name=srs.name, dtype=dtype)
+
+
+def _str_to_codepoints(s: Union[str, Iterable[str]]) -> np.ndarray:
+    """Convert a string into an array of the unicode codepoints of its chars. Collections of chars are joined
+    into a single string first."""
+    if not isinstance(s, str):
+        s = "".join(s)
+
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _char_matrix_to_array(arr_chars: np.ndarray, arr_str_len: np.ndarray) -> np.ndarray:
+    """Convert a matrix with one char per cell back into an array of strings with the provided lengths.
+    Numpy drops trailing empty chars, so strings that end on NUL chars are padded back to their length."""
+    arr_chars = np.ascontiguousarray(arr_chars)
+    arr_str_out = arr_chars.view(f"U{arr_chars.shape[1]}").ravel().astype(object)
+    # only strings that end on a NUL char are truncated, so it's enough to check their last char
+    mask_truncated = arr_str_len > 0
+    mask_truncated[mask_truncated] = (
+        arr_chars.view(np.uint32)[
+            np.flatnonzero(mask_truncated), arr_str_len[mask_truncated] - 1
+        ]
+        == 0
+    )
+
+    if mask_truncated.any():
+        arr_str_out[mask_truncated] = [
+            s.ljust(str_len, "\x00")
+            for s, str_len in zip(
+                arr_str_out[mask_truncated], arr_str_len[mask_truncated]
+            )
+        ]
+
+    return arr_str_out
+
+
 @dataclass(frozen=True)
 class KeyMutation:
     row: list[str] = field(default_factory=list)
@@ -70,6 +162,7 @@ def with_function(
     Notes:
         This function should be used sparingly since it is not vectorized.
         Only use it for testing purposes or if performance is not important.
+        Use `with_vectorized_function` for functions that can mutate all values of a series at once.
 
     Args:
         func: function to invoke to mutate data with
@@ -81,12 +174,44 @@ def with_function(
     """
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        srs_out = srs.copy()
+        # collect mutated values in a list instead of writing them into a series one by one
+        return _new_series_like(
+            [func(s, *args, **kwargs) for s in srs.to_numpy(dtype=object)], srs
+        )
+
+    def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
+        return [_mutate_series(srs) for srs in srs_lst]
+
+    return _mutate
+
+
+def with_vectorized_function(
+    func: Callable[Concatenate[pd.Series, P], Union[pd.Series, np.ndarray]],
+    *args: object,
+    **kwargs: object,
+) -> Mutator:
+    """
+    Mutate data using an arbitrary function that mutates all values of a series at once.
+    The function receives the whole series and must return a series or an array of the same length.
 
-        for i in range(len(srs_out)):
-            srs_out.iloc[i] = func(srs_out.iloc[i], *args, **kwargs)
+    Args:
+        func: function to invoke to mutate data with
+        *args: positional arguments to pass to `func`
+        **kwargs: keyword arguments to pass to `func`
 
-        return srs_out
+    Returns:
+        function returning list with strings mutated using custom function
+    """
+
+    def _mutate_series(srs: pd.Series) -> pd.Series:
+        arr_mutated = np.asarray(func(srs, *args, **kwargs), dtype=object)
+
+        if arr_mutated.shape != (len(srs),):
+            raise ValueError(
+                f"function must return {len(srs)} values, got array of shape {arr_mutated.shape}"
+            )
+
+        return _new_series_like(arr_mutated, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -94,56 +219,32 @@ def with_function(
     return _mutate
 
 
-def with_cldr_keymap_file(
-    cldr_path: Union[PathLike, str],
-    charset: Optional[str] = None,
-    rng: Optional[np.random.Generator] = None,
-) -> Mutator:
+@cache_by_file()
+def _load_kb_tables(
+    cldr_path: Union[PathLike, str], charset: Union[str, frozenset[str], None]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Mutate data by randomly introducing typos.
-    Potential typos are sourced from a Common Locale Data Repository (CLDR) keymap.
-    Any character may be replaced with one of its horizontal or vertical neighbors on a keyboard.
-    They may also be replaced with its upper- or lowercase variant.
-    It is possible for a string to not be modified if a selected character has no possible replacements.
+    Build the typo lookup tables from a CLDR keymap file. Results are cached, so the file is only parsed
+    once for each combination of path and charset until it is modified. The returned arrays are read-only since they are shared
+    between all mutators that are created from the same arguments.
 
     Args:
         cldr_path: path to CLDR keymap file
-        charset: string with characters that may be mutated
-        rng: random number generator to use
+        charset: string or set with characters that may be mutated
 
     Returns:
-        function returning list with strings mutated by applying typos according to keymap file
+        sorted codepoints that have typo candidates, amount of candidates per codepoint and
+        a zero-padded table with one row of candidate codepoints per codepoint
     """
-    if rng is None:
-        rng = np.random.default_rng()
-
     with Path(cldr_path).open(mode="r", encoding="utf-8") as f:
         tree = etree.parse(f)
 
     root = tree.getroot()
 
-    # compute the row and column count
-    max_row, max_col = 0, 0
-
-    for map_node in root.iterfind("./keyMap/map"):
-        # decode_iso_kb_pos is cached so calling this repeatedly shouldn't have an impact on performance
-        kb_row, kb_col = decode_iso_kb_pos(map_node.get("iso"))
-        max_row = max(max_row, kb_row)
-        max_col = max(max_col, kb_col)
-
-    kb_map = np.chararray(
-        shape=(
-            max_row + 1,
-            max_col + 1,
-            2,
-        ),  # + 1 because rows and cols are zero-indexed, 2 to accommodate shift
-        itemsize=1,  # each cell holds one unicode char
-        unicode=True,
-    )
-    kb_map[:] = ""  # initialize with empty strings
-
-    # remember the kb pos for each character
-    kb_char_to_kb_pos_dict: dict[str, (int, int, int)] = {}
+    # positions of all keys, used for computing the row and column count
+    kb_pos_list: list[tuple[int, int]] = []
+    # keys that can be entered into the keymap as (row, column, modifier, char)
+    kb_key_list: list[tuple[int, int, int, str]] = []
 
     for key_map_node in root.iterfind("./keyMap"):
         key_map_mod = key_map_node.get("modifiers")
@@ -153,98 +254,194 @@ def with_cldr_keymap_file(
         elif key_map_mod == "shift":
             kb_mod = 1
         else:
-            continue
+            kb_mod = None
 
         for map_node in key_map_node.iterfind("./map"):
+            # decode_iso_kb_pos is cached so calling this repeatedly shouldn't have an impact on performance
             kb_row, kb_col = decode_iso_kb_pos(map_node.get("iso"))
+            kb_pos_list.append((kb_row, kb_col))
+
+            # only keys without modifiers or with shift are considered
+            if kb_mod is None:
+                continue
+
             kb_char = unescape_kb_char(map_node.get("to"))
 
             # check that char is listed if charset of permitted chars is provided
             if charset is not None and kb_char not in charset:
                 continue
 
-            kb_char_to_kb_pos_dict[kb_char] = (kb_row, kb_col, kb_mod)
-            kb_map[kb_row, kb_col, kb_mod] = kb_char
+            # keys that don't produce exactly one char can't be represented by a single codepoint
+            if len(kb_char) != 1:
+                continue
 
-    # map each character with other nearby characters that it could be replaced with due to a typo
-    kb_char_to_candidates_dict: dict[str, str] = {}
+            kb_key_list.append((kb_row, kb_col, kb_mod, kb_char))
 
-    with np.nditer(kb_map, flags=["multi_index"], op_flags=[["readonly"]]) as it:
-        for kb_char in it:
-            # iterator returns str as array of unicode chars. convert it to str.
-            kb_char = str(kb_char)
+    # compute the row and column count
+    max_row, max_col = np.max(
+        np.array(kb_pos_list, dtype=int).reshape(-1, 2), axis=0, initial=0
+    )
 
-            # skip keys that don't have a character assigned to them
-            if kb_char == "":
-                continue
+    # each cell holds the codepoint of the char assigned to a key, or zero if there is none.
+    # + 1 because rows and cols are zero-indexed, 2 to accommodate shift.
+    kb_map = np.zeros((max_row + 1, max_col + 1, 2), dtype=np.uint32)
+
+    for kb_row, kb_col, kb_mod, kb_char in kb_key_list:
+        kb_map[kb_row, kb_col, kb_mod] = ord(kb_char)
+
+    # copy of the keymap with whitespace keys blanked out since they are never selected as a typo candidate.
+    # codepoints are reinterpreted as unicode chars to run the check on the entire keymap at once.
+    kb_map_candidates = np.where(np.char.isspace(kb_map.view("U1")), 0, kb_map)
+
+    # stack neighboring chars along a new axis: upper, left, lower and right key, then the same key with the
+    # modifier flipped. np.roll wraps around at the edges of the keyboard, so these positions are blanked out.
+    kb_map_neighbors = np.stack(
+        [
+            np.roll(kb_map_candidates, 1, axis=0),
+            np.roll(kb_map_candidates, 1, axis=1),
+            np.roll(kb_map_candidates, -1, axis=0),
+            np.roll(kb_map_candidates, -1, axis=1),
+            kb_map_candidates[:, :, ::-1],
+        ],
+        axis=-1,
+    )
+    kb_map_neighbors[0, :, :, 0] = 0
+    kb_map_neighbors[:, 0, :, 1] = 0
+    kb_map_neighbors[-1, :, :, 2] = 0
+    kb_map_neighbors[:, -1, :, 3] = 0
+
+    # it may happen that the char is the same despite the kb modifier. that needs to be accounted for.
+    mask_kb_neighbors = (kb_map_neighbors != 0) & (
+        kb_map_neighbors != kb_map[..., np.newaxis]
+    )
 
-            kb_pos = it.multi_index
-            # noinspection PyTypeChecker
-            kb_pos_neighbors = get_neighbor_kb_pos_for(kb_pos, max_row, max_col)
-            kb_char_candidates = set()
-
-            for kb_pos_neighbor in kb_pos_neighbors:
-                kb_char_candidate = kb_map[kb_pos_neighbor]
-
-                # check that the key pos has a char assigned to it. it may also happen that the char is the same
-                # despite the kb modifier. that needs to be accounted for.
-                if kb_char_candidate != "" and kb_char_candidate != kb_char:
-                    kb_char_candidates.add(kb_char_candidate)
-
-            # check that there are any candidates
-            if len(kb_char_candidates) > 0:
-                kb_char_to_candidates_dict[kb_char] = "".join(
-                    sorted(
-                        kb_char_candidates
-                    )  # needs to be sorted to ensure reproducibility
-                )
+    # map the codepoint of each character with the codepoints of other nearby characters that it could be
+    # replaced with due to a typo
+    kb_codepoint_to_candidates_dict: dict[int, list[int]] = {}
 
-    def _mutate_series(srs: pd.Series) -> pd.Series:
-        srs_out = srs.copy()
-        str_count = len(srs_out)
+    # only visit keys that have a character assigned to them
+    for kb_pos in zip(*np.nonzero(kb_map)):
+        kb_codepoint_candidates = set(
+            kb_map_neighbors[kb_pos][mask_kb_neighbors[kb_pos]].tolist()
+        )
 
-        # string length series
-        srs_str_out_len = srs_out.str.len()
-        # random indices
-        arr_rng_vals = rng.random(size=str_count)
-        arr_rng_typo_indices = np.floor(srs_str_out_len * arr_rng_vals).astype(int)
+        # check that there are any candidates
+        if len(kb_codepoint_candidates) > 0:
+            kb_codepoint_to_candidates_dict[int(kb_map[kb_pos])] = sorted(
+                kb_codepoint_candidates
+            )  # needs to be sorted to ensure reproducibility
 
-        # create a new series containing the chars that have been randomly selected for replacement
-        srs_typo_chars = pd.Series(dtype=str, index=srs_out.index)
-        arr_uniq_idx = arr_rng_typo_indices.unique()
+    # sorted table of codepoints that have candidates, and a lookup table with one row of candidates per
+    # codepoint. rows are padded with zeros, so the amount of candidates per codepoint is tracked separately.
+    arr_kb_source_codepoints = np.array(
+        sorted(kb_codepoint_to_candidates_dict.keys()), dtype=np.uint32
+    )
+    arr_kb_candidate_counts = np.array(
+        [len(kb_codepoint_to_candidates_dict[c]) for c in arr_kb_source_codepoints],
+        dtype=int,
+    )
+    arr_kb_candidate_codepoints = np.zeros(
+        (len(arr_kb_source_codepoints), max(arr_kb_candidate_counts, default=0)),
+        dtype=np.uint32,
+    )
 
-        for i in arr_uniq_idx:
-            idx_mask = arr_rng_typo_indices == i
-            srs_typo_chars[idx_mask] = srs_out[idx_mask].str[i]
+    for i, kb_codepoint in enumerate(arr_kb_source_codepoints):
+        arr_kb_candidate_codepoints[
+            i, : arr_kb_candidate_counts[i]
+        ] = kb_codepoint_to_candidates_dict[kb_codepoint]
+    for arr in (
+        arr_kb_source_codepoints,
+        arr_kb_candidate_counts,
+        arr_kb_candidate_codepoints,
+    ):
+        arr.flags.writeable = False
+
+    return (
+        arr_kb_source_codepoints,
+        arr_kb_candidate_counts,
+        arr_kb_candidate_codepoints,
+    )
 
-        # create a new series that will track the replacement chars for the selected chars
-        srs_repl_chars = pd.Series(dtype=str, index=srs_out.index)
-        arr_uniq_chars = srs_typo_chars.unique()
 
-        for char in arr_uniq_chars:
-            # check if there are any possible replacements for this char
-            if char not in kb_char_to_candidates_dict:
-                continue
+def with_cldr_keymap_file(
+    cldr_path: Union[PathLike, str],
+    charset: Union[str, Iterable[str], None] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Mutator:
+    """
+    Mutate data by randomly introducing typos.
+    Potential typos are sourced from a Common Locale Data Repository (CLDR) keymap.
+    Any character may be replaced with one of its horizontal or vertical neighbors on a keyboard.
+    They may also be replaced with its upper- or lowercase variant.
+    It is possible for a string to not be modified if a selected character has no possible replacements.
 
-            # get candidate strings
-            char_candidates = kb_char_to_candidates_dict[char]
-            # count the rows that have this character selected
-            char_count = (srs_typo_chars == char).sum()
-            # draw replacements for the current character
-            rand_chars = rng.choice(list(char_candidates), size=char_count)
-            srs_repl_chars[srs_typo_chars == char] = rand_chars
-
-        for i in arr_uniq_idx:
-            # there is a possibility that a char might not have a replacement, so pd.notna() will have to
-            # act as an extra filter to not modify strings that have no replacement
-            idx_mask = (arr_rng_typo_indices == i) & pd.notna(srs_repl_chars)
-            srs_out[idx_mask] = (
-                srs_out[idx_mask].str[:i]
-                + srs_repl_chars[idx_mask]
-                + srs_out[idx_mask].str[i + 1 :]
-            )
+    Args:
+        cldr_path: path to CLDR keymap file
+        charset: string or collection of characters that may be mutated
+        rng: random number generator to use
 
-        return srs_out
+    Returns:
+        function returning list with strings mutated by applying typos according to keymap file
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    (
+        arr_kb_source_codepoints,
+        arr_kb_candidate_counts,
+        arr_kb_candidate_codepoints,
+    ) = _load_kb_tables(
+        cldr_path,
+        # loaded tables are cached by their arguments, so the charset must be hashable
+        charset if charset is None or isinstance(charset, str) else frozenset(charset),
+    )
+
+    def _mutate_series(srs: pd.Series) -> pd.Series:
+        str_count = len(srs)
+
+        # check that there are any strings to modify and any chars to replace them with
+        if str_count == 0 or len(arr_kb_source_codepoints) == 0:
+            return srs
+
+        # missing values are turned into strings in the char matrix, so they must be excluded explicitly
+        mask_notna = srs.notna().to_numpy()
+        arr_str_len = srs.str.len().to_numpy(dtype=int, na_value=0)
+        # lay out strings as a matrix with one codepoint per cell
+        arr_codepoints = _series_to_char_matrix(srs).view(np.uint32)
+        # random indices. empty strings are given an upper bound of one, which selects the zero padding.
+        arr_rng_typo_indices = rng.integers(0, np.maximum(arr_str_len, 1))
+
+        # pick the codepoints selected for replacement. empty strings yield a zero which never has any
+        # candidates.
+        arr_row_indices = np.arange(str_count)
+        arr_typo_codepoints = arr_codepoints[arr_row_indices, arr_rng_typo_indices]
+
+        # look up the selected codepoints in the candidate table. if a codepoint is not present, then it has
+        # no possible replacements and the string must not be modified.
+        arr_source_idx = np.searchsorted(arr_kb_source_codepoints, arr_typo_codepoints)
+        arr_source_idx[arr_source_idx == len(arr_kb_source_codepoints)] = 0
+        mask_has_repl = (
+            arr_kb_source_codepoints[arr_source_idx] == arr_typo_codepoints
+        ) & mask_notna
+
+        # draw a random candidate for each selected codepoint
+        arr_candidate_idx = rng.integers(0, arr_kb_candidate_counts[arr_source_idx])
+
+        # only rows with a replacement need to be written to and converted back into strings
+        arr_codepoints_repl = arr_codepoints[mask_has_repl]
+        arr_codepoints_repl[
+            np.arange(len(arr_codepoints_repl)), arr_rng_typo_indices[mask_has_repl]
+        ] = arr_kb_candidate_codepoints[
+            arr_source_idx[mask_has_repl], arr_candidate_idx[mask_has_repl]
+        ]
+
+        # write modified strings positionally into a copy of the input strings
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[mask_has_repl] = _char_matrix_to_array(
+            arr_codepoints_repl.view("U1"), arr_str_len[mask_has_repl]
+        )
+
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -252,6 +449,83 @@ def with_cldr_keymap_file(
     return _mutate
 
 
+@cache_by_file()
+def _load_phonetic_replacement_rules(
+    csv_file_path: Union[PathLike, str],
+    source_column: Union[int, str],
+    target_column: Union[int, str],
+    flags_column: Union[int, str],
+    encoding: str,
+    delimiter: str,
+) -> tuple[_PhoneticReplacementRule, ...]:
+    """
+    Parse phonetic replacement rules from a CSV file. Results are cached, so the file is only parsed once
+    for each combination of arguments until it is modified.
+
+    Args:
+        csv_file_path: path to CSV file containing phonetic replacement rules
+        source_column: name or index of source column
+        target_column: name or index of target column
+        flags_column: name or index of flag column
+        encoding: character encoding of the CSV file
+        delimiter: column delimiter of the CSV file
+
+    Returns:
+        tuple of parsed phonetic replacement rules
+    """
+    # list of all flags. needs to be sorted for rng.
+    _all_flags = "".join(sorted("^$_"))
+    header = isinstance(flags_column, str)
+
+    # read csv file
+    df = pd.read_csv(
+        csv_file_path,
+        header=0 if header else None,
+        dtype=str,
+        usecols=[source_column, target_column, flags_column],
+        sep=delimiter,
+        encoding=encoding,
+    )
+
+    # rules without flags can be applied anywhere, so they are assigned all flags
+    srs_flags = df[flags_column].fillna("").replace("", _all_flags)
+    # strip all valid flags. anything that remains is an unknown flag.
+    srs_unknown_flags = srs_flags.str.replace(
+        f"[{re.escape(_all_flags)}]", "", regex=True
+    )
+    mask_unknown_flags = srs_unknown_flags != ""
+
+    if mask_unknown_flags.any():
+        raise ValueError(
+            f"unknown flag: {srs_unknown_flags[mask_unknown_flags].iloc[0][0]}"
+        )
+
+    # parse replacement rules
+    phonetic_replacement_rules: list[_PhoneticReplacementRule] = []
+
+    for pattern, replacement, flags in zip(
+        df[source_column].to_numpy(),
+        df[target_column].to_numpy(),
+        srs_flags.to_numpy(),
+    ):
+        pattern_escaped = re.escape(pattern)
+
+        phonetic_replacement_rules.append(
+            _PhoneticReplacementRule(
+                pattern,
+                replacement,
+                flags,
+                re.compile(f"^{pattern_escaped}"),
+                re.compile(f"{pattern_escaped}$"),
+                # matching groups are the parts that are supposed to be preserved
+                # (anything but the string to replace).
+                re.compile(f"^(.+){pattern_escaped}(.+)$"),
+            )
+        )
+
+    return tuple(phonetic_replacement_rules)
+
+
 def with_phonetic_replacement_table(
     csv_file_path: Union[PathLike, str],
     source_column: Union[int, str] = 0,
@@ -286,20 +560,6 @@ def with_phonetic_replacement_table(
         function returning list with strings mutated by applying phonetic errors according to rules in CSV file
     """
 
-    # list of all flags. needs to be sorted for rng.
-    _all_flags = "".join(sorted("^$_"))
-
-    def _validate_flags(flags_str: Optional[str]) -> str:
-        """Check a string for valid flags. Returns all flags if string is empty, `NaN` or `None`."""
-        if pd.isna(flags_str) or flags_str == "" or flags_str is None:
-            return _all_flags
-
-        for char in flags_str:
-            if char not in _all_flags:
-                raise ValueError(f"unknown flag: {char}")
-
-        return flags_str
-
     def __new_unknown_flag_error(flag: str):
         return ValueError(f"invalid state: unknown flag `{flag}`")
 
@@ -317,90 +577,91 @@ def with_phonetic_replacement_table(
             "source, target and flags columns must be either a string or an integer"
         )
 
-    header = isinstance(flags_column, str)
-
-    # read csv file
-    df = pd.read_csv(
+    phonetic_replacement_rules = _load_phonetic_replacement_rules(
         csv_file_path,
-        header=0 if header else None,
-        dtype=str,
-        usecols=[source_column, target_column, flags_column],
-        sep=delimiter,
-        encoding=encoding,
+        source_column,
+        target_column,
+        flags_column,
+        encoding,
+        delimiter,
     )
 
-    # parse replacement rules
-    phonetic_replacement_rules: list[_PhoneticReplacementRule] = []
-
-    for _, row in df.iterrows():
-        pattern = row[source_column]
-        replacement = row[target_column]
-        flags = _validate_flags(row[flags_column])
-
-        phonetic_replacement_rules.append(
-            _PhoneticReplacementRule(pattern, replacement, flags)
-        )
+    # lengths of all patterns, aligned with the list of rules
+    arr_pattern_len = np.array(
+        [len(rule.pattern) for rule in phonetic_replacement_rules], dtype=int
+    )
+    # flags of all rules as boolean arrays, aligned with the list of rules
+    arr_rule_has_start_flag = np.array(
+        ["^" in rule.flags for rule in phonetic_replacement_rules], dtype=bool
+    )
+    arr_rule_has_end_flag = np.array(
+        ["$" in rule.flags for rule in phonetic_replacement_rules], dtype=bool
+    )
+    arr_rule_has_middle_flag = np.array(
+        ["_" in rule.flags for rule in phonetic_replacement_rules], dtype=bool
+    )
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        # create a copy of input series
-        srs_out = srs.copy()
-        # get series of string lengths
-        srs_str_out_len = srs_out.str.len()
+        # create a copy of input strings
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
         # get series length
-        str_count = len(srs_out)
-        # create series to compute substitution probability
-        srs_str_sub_prob = pd.Series(dtype=float, index=srs_out.index)
-        srs_str_sub_prob[:] = 0
-        # track possible replacements for each rule
-        rule_to_flag_dict: dict[_PhoneticReplacementRule, pd.Series] = {}
-
-        for rule in phonetic_replacement_rules:
-            # increment absolute frequency for each string where rule applies
-            srs_str_flags = pd.Series(dtype=str, index=srs_out.index)
-            srs_str_flags[:] = ""
-
-            # find pattern in series
-            srs_pattern_idx = srs_out.str.find(rule.pattern)
-
-            if "^" in rule.flags:
-                # increment counter for all strings where pattern is found at start of string
-                mask_pattern_at_start = srs_pattern_idx == 0
-                srs_str_flags[mask_pattern_at_start] += "^"
-
-            if "$" in rule.flags:
-                # increment counter for all strings where pattern is found at end of string
-                mask_pattern_at_end = (
-                    srs_pattern_idx + len(rule.pattern) == srs_str_out_len
-                )
-                srs_str_flags[mask_pattern_at_end] += "$"
+        str_count = len(srs)
+        # rows with missing values are never mutated
+        mask_notna = srs.notna().to_numpy()
+        # get array of string lengths as column vector to compare against all rules at once
+        arr_str_out_len = srs.str.len().to_numpy(dtype=int, na_value=0).reshape(-1, 1)
+        # track first and last position of the pattern of each rule (columns) in each string (rows)
+        arr_pattern_first_idx = np.full(
+            (str_count, len(phonetic_replacement_rules)), -1, dtype=int
+        )
+        arr_pattern_last_idx = arr_pattern_first_idx.copy()
 
-            if "_" in rule.flags:
-                # increment counter for all strings where pattern is not at the start and at the end
-                mask_pattern_in_middle = (srs_pattern_idx > 0) & (
-                    srs_pattern_idx + len(rule.pattern) < srs_str_out_len
-                )
-                srs_str_flags[mask_pattern_in_middle] += "_"
+        for j, rule in enumerate(phonetic_replacement_rules):
+            arr_pattern_first_idx[:, j] = srs.str.find(rule.pattern).to_numpy(
+                dtype=int, na_value=-1
+            )
+            arr_pattern_last_idx[:, j] = srs.str.rfind(rule.pattern).to_numpy(
+                dtype=int, na_value=-1
+            )
 
-            rule_to_flag_dict[rule] = srs_str_flags
-            srs_str_sub_prob[srs_str_flags != ""] += 1
+        # strings that start with the pattern
+        mask_pattern_at_start = arr_pattern_first_idx == 0
+        # strings that end with the pattern
+        mask_pattern_at_end = (arr_pattern_last_idx != -1) & (
+            arr_pattern_last_idx + arr_pattern_len == arr_str_out_len
+        )
+        # strings where the first occurrence of the pattern is found at the end of the string
+        mask_first_pattern_at_end = (
+            arr_pattern_first_idx + arr_pattern_len == arr_str_out_len
+        )
+        # strings where the first occurrence of the pattern is not at the start and at the end
+        mask_first_pattern_in_middle = (arr_pattern_first_idx > 0) & (
+            arr_pattern_first_idx + arr_pattern_len < arr_str_out_len
+        )
 
+        # select all strings where a rule can be applied with at least one of its flags
+        mask_rule_applies = (
+            (mask_pattern_at_start & arr_rule_has_start_flag)
+            | (mask_first_pattern_at_end & arr_rule_has_end_flag)
+            | (mask_first_pattern_in_middle & arr_rule_has_middle_flag)
+        ) & mask_notna[:, np.newaxis]
+
+        # count applicable rules for each string
+        arr_str_sub_prob = mask_rule_applies.sum(axis=1).astype(float)
         # prevent division by zero
-        mask_eligible_strs = srs_str_sub_prob != 0
+        mask_eligible_strs = arr_str_sub_prob != 0
         # absolute -> relative frequency
-        srs_str_sub_prob[mask_eligible_strs] = 1 / srs_str_sub_prob[mask_eligible_strs]
+        arr_str_sub_prob[mask_eligible_strs] = 1 / arr_str_sub_prob[mask_eligible_strs]
         # keep track of modified rows
-        mask_modified_rows = pd.Series(dtype=bool, index=srs_out.index)
-        mask_modified_rows[:] = False
+        mask_modified_rows = np.full(str_count, False)
 
-        for rule in phonetic_replacement_rules:
+        for j, rule in enumerate(phonetic_replacement_rules):
             # draw random numbers for each row
             arr_rand_vals = rng.random(size=str_count)
-            # get flags that were generated for each row
-            srs_str_flags = rule_to_flag_dict[rule]
             # get candidate row mask
-            mask_candidate_rows = (arr_rand_vals < srs_str_sub_prob) & (
-                srs_str_flags != ""
-            )
+            mask_candidate_rows = (
+                arr_rand_vals < arr_str_sub_prob
+            ) & mask_rule_applies[:, j]
 
             # create copy of rule flags and shuffle it in-place
             arr_rand_flags = list(rule.flags)
@@ -408,15 +669,16 @@ def with_phonetic_replacement_table(
 
             for flag in arr_rand_flags:
                 # select rows that can have the current rule applied to them, fit into the correct flag
-                # and haven't been modified yet
+                # and haven't been modified yet. rows that haven't been modified yet still match the
+                # input series, so the masks computed above can be reused.
                 if flag == "^":
-                    mask_current_flag = srs_out.str.startswith(rule.pattern)
+                    mask_current_flag = mask_pattern_at_start[:, j]
                 elif flag == "$":
-                    mask_current_flag = srs_out.str.endswith(rule.pattern)
+                    mask_current_flag = mask_pattern_at_end[:, j]
                 elif flag == "_":
                     # not at the start and not at the end
-                    mask_current_flag = ~srs_out.str.startswith(rule.pattern) & (
-                        ~srs_out.str.endswith(rule.pattern)
+                    mask_current_flag = (
+                        ~mask_pattern_at_start[:, j] & ~mask_pattern_at_end[:, j]
                     )
                 else:
                     raise __new_unknown_flag_error(flag)
@@ -426,35 +688,30 @@ def with_phonetic_replacement_table(
                 )
 
                 # skip if there are no replacements to be made
-                if mask_current_candidate_rows.sum() == 0:
+                if not mask_current_candidate_rows.any():
                     continue
 
                 if flag == "^":
-                    srs_out[mask_current_candidate_rows] = srs_out[
-                        mask_current_candidate_rows
-                    ].str.replace(f"^{rule.pattern}", rule.replacement, n=1, regex=True)
+                    regex, replacement = rule.regex_start, rule.replacement
                 elif flag == "$":
-                    srs_out[mask_current_candidate_rows] = srs_out[
-                        mask_current_candidate_rows
-                    ].str.replace(f"{rule.pattern}$", rule.replacement, n=1, regex=True)
+                    regex, replacement = rule.regex_end, rule.replacement
                 elif flag == "_":
-                    # matching groups are the parts that are supposed to be preserved
-                    # (anything but the string to replace).
-                    srs_out[mask_current_candidate_rows] = srs_out[
-                        mask_current_candidate_rows
-                    ].str.replace(
-                        f"^(.+){rule.pattern}(.+)$",
-                        f"\\1{rule.replacement}\\2",
-                        n=1,
-                        regex=True,
+                    regex, replacement = (
+                        rule.regex_middle,
+                        f"\\g<1>{rule.replacement}\\g<2>",
                     )
                 else:
                     raise __new_unknown_flag_error(flag)
 
+                arr_str_out[mask_current_candidate_rows] = [
+                    regex.sub(replacement, s, count=1)
+                    for s in arr_str_out[mask_current_candidate_rows]
+                ]
+
                 # update modified row series
                 mask_modified_rows |= mask_current_candidate_rows
 
-        return srs_out
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -462,6 +719,66 @@ def with_phonetic_replacement_table(
     return _mutate
 
 
+@cache_by_file()
+def _load_replacement_table(
+    csv_file_path: Union[PathLike, str],
+    source_column: Union[str, int],
+    target_column: Union[str, int],
+    encoding: str,
+    delimiter: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the lookup tables for a replacement table from a CSV file. Results are cached, so the file is
+    only parsed once for each combination of arguments until it is modified. The returned arrays are read-only since they are
+    shared between all mutators that are created from the same arguments.
+
+    Args:
+        csv_file_path: path to CSV file
+        source_column: name or index of the source column
+        target_column: name or index of the target column
+        encoding: character encoding of the CSV file
+        delimiter: column delimiter of the CSV file
+
+    Returns:
+        unique source values, amount of target values per source value and an empty string-padded
+        table with one row of target values per source value
+    """
+    header = isinstance(target_column, str)
+
+    df = pd.read_csv(
+        csv_file_path,
+        header=0 if header else None,
+        dtype=str,
+        usecols=[source_column, target_column],
+        sep=delimiter,
+        encoding=encoding,
+    )
+
+    srs_unique_source_values = df[source_column].unique()
+    # lookup table with one row of target values per source value. rows are padded with empty strings,
+    # so the amount of target values per source value is tracked separately.
+    target_values_per_source = [
+        df[df[source_column] == source][target_column].tolist()
+        for source in srs_unique_source_values
+    ]
+    arr_target_value_counts = np.array(
+        [len(target_values) for target_values in target_values_per_source], dtype=int
+    )
+    arr_target_values = np.full(
+        (len(srs_unique_source_values), max(arr_target_value_counts, default=0)),
+        "",
+        dtype=object,
+    )
+
+    for j, target_values in enumerate(target_values_per_source):
+        arr_target_values[j, : len(target_values)] = target_values
+
+    for arr in (srs_unique_source_values, arr_target_value_counts, arr_target_values):
+        arr.flags.writeable = False
+
+    return srs_unique_source_values, arr_target_value_counts, arr_target_values
+
+
 def with_replacement_table(
     csv_file_path: Union[PathLike, str],
     source_column: Union[str, int] = 0,
@@ -505,98 +822,75 @@ def with_replacement_table(
             "source and target columns must be either a string or an integer"
         )
 
-    header = isinstance(target_column, str)
-
-    df = pd.read_csv(
-        csv_file_path,
-        header=0 if header else None,
-        dtype=str,
-        usecols=[source_column, target_column],
-        sep=delimiter,
-        encoding=encoding,
+    (
+        srs_unique_source_values,
+        arr_target_value_counts,
+        arr_target_values,
+    ) = _load_replacement_table(
+        csv_file_path, source_column, target_column, encoding, delimiter
     )
 
-    srs_unique_source_values = df[source_column].unique()
-
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        # create copy of input series
-        srs_out = srs.copy()
-        str_count = len(srs_out)
-        # create series to compute probability of substitution for each row
-        srs_str_sub_prob = pd.Series(dtype=float, index=srs_out.index)
-        srs_str_sub_prob[:] = 0
+        # check that there are any source values to replace
+        if len(srs_unique_source_values) == 0:
+            return srs
 
-        for source in srs_unique_source_values:
-            # increment absolute frequency for each string containing source value by one
-            srs_str_sub_prob[srs_out.str.contains(source)] += 1
+        # strings tend to repeat, so only unique strings are scanned for source values
+        arr_str_codes, arr_str_uniques = pd.factorize(srs)
+        srs_str_uniques = _to_arrow_str_series(pd.Series(arr_str_uniques, dtype=object))
+        # track which unique strings (rows) contain which source values (columns)
+        mask_unique_contains_source = np.full(
+            (len(srs_str_uniques), len(srs_unique_source_values)), False
+        )
 
+        for j, source in enumerate(srs_unique_source_values):
+            mask_unique_contains_source[:, j] = srs_str_uniques.str.contains(
+                source, regex=False
+            ).to_numpy(dtype=bool)
+
+        # map results back onto all strings. missing values are given a code of -1 and never contain any
+        # source values.
+        mask_notna = arr_str_codes != -1
+        mask_contains_source = np.full((len(srs), len(srs_unique_source_values)), False)
+        mask_contains_source[mask_notna] = mask_unique_contains_source[
+            arr_str_codes[mask_notna]
+        ]
+
+        # compute probability of substitution for each row by counting the source values it contains
+        arr_str_sub_prob = mask_contains_source.sum(axis=1).astype(float)
         # prevent division by zero
-        mask_eligible_strs = srs_str_sub_prob != 0
+        mask_eligible_strs = arr_str_sub_prob != 0
         # convert absolute frequencies into relative frequencies
-        srs_str_sub_prob[mask_eligible_strs] = 1 / srs_str_sub_prob[mask_eligible_strs]
+        arr_str_sub_prob[mask_eligible_strs] = 1 / arr_str_sub_prob[mask_eligible_strs]
 
-        # create dataframe to track source and target for each row
-        df_replacement = pd.DataFrame(
-            index=srs_out.index, columns=["source", "target"], dtype=str
+        # draw random numbers for each row and source value. select only source values that are contained
+        # in a string and have a random number drawn that's in range of its probability to be modified.
+        arr_rand_vals = rng.random(size=mask_contains_source.shape)
+        mask_source_selected = mask_contains_source & (
+            arr_rand_vals < arr_str_sub_prob[:, np.newaxis]
         )
-
-        for source in srs_unique_source_values:
-            # select all rows that contain the source value
-            srs_str_contains_source = srs_out.str.contains(source)
-            # draw random numbers for each row
-            arr_rand_vals = rng.random(size=str_count)
-            # select only rows that contain the source string, have a random number drawn that's
-            # in range of its probability to be modified, and hasn't been marked for replacement yet
-            mask_strings_to_replace = (
-                srs_str_contains_source
-                & (arr_rand_vals < srs_str_sub_prob)
-                & pd.isna(df_replacement["source"])
+        # the first selected source value is the one to be replaced
+        arr_source_idx = np.argmax(mask_source_selected, axis=1)
+        mask_strings_to_replace = mask_source_selected.any(axis=1)
+
+        # draw a random target value for each row
+        arr_target_idx = rng.integers(0, arr_target_value_counts[arr_source_idx])
+
+        arr_source_idx = arr_source_idx[mask_strings_to_replace]
+        arr_target_idx = arr_target_idx[mask_strings_to_replace]
+
+        # perform replacement of source -> target
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[mask_strings_to_replace] = [
+            s.replace(source, target, 1)
+            for s, source, target in zip(
+                arr_str_out[mask_strings_to_replace],
+                srs_unique_source_values[arr_source_idx],
+                arr_target_values[arr_source_idx, arr_target_idx],
             )
-            # count all strings that meet the conditions above
-            replacement_count = mask_strings_to_replace.sum()
-
-            # skip if there are no replacements to be made
-            if replacement_count == 0:
-                continue
-
-            # fill in the source column of the replacement table
-            df_replacement.loc[mask_strings_to_replace, "source"] = source
-
-            # select all target values that can be generated from the current source value
-            replacement_options = df[df[source_column] == source][
-                target_column
-            ].tolist()
-
-            # trivial case
-            if len(replacement_options) == 1:
-                target = replacement_options[0]
-                df_replacement.loc[mask_strings_to_replace, "target"] = target
-                continue
-
-            # otherwise draw a random target value for each row
-            df_replacement.loc[mask_strings_to_replace, "target"] = rng.choice(
-                replacement_options, size=replacement_count
-            )
-
-        # iterate over all unique source values
-        for source in df_replacement["source"].unique():
-            # skip nan
-            if pd.isna(source):
-                continue
-
-            # for each unique source value, iterate over its unique target values
-            for target in df_replacement[df_replacement["source"] == source][
-                "target"
-            ].unique():
-                # select all rows that have this specific source -> target replacement going
-                mask = (df_replacement["source"] == source) & (
-                    df_replacement["target"] == target
-                )
-
-                # perform replacement of source -> target
-                srs_out[mask] = srs_out[mask].str.replace(source, target, n=1)
+        ]
 
-        return srs_out
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -640,9 +934,9 @@ def _mutate_only_empty_from_value(value: str) -> Mutator:
     """
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        srs_out = srs.copy()
-        srs_out[srs_out == ""] = value
-        return srs_out
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[(srs == "").to_numpy(dtype=bool, na_value=False)] = value
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -663,9 +957,11 @@ def _mutate_only_blank_from_value(value: str) -> Mutator:
     """
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        srs_out = srs.copy()
-        srs_out[srs_out.str.strip() == ""] = value
-        return srs_out
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[
+            (srs.str.strip() == "").to_numpy(dtype=bool, na_value=False)
+        ] = value
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -720,38 +1016,47 @@ def with_insert(
     if rng is None:
         rng = np.random.default_rng()
 
+    # codepoints of chars to sample from
+    arr_charset_codepoints = _str_to_codepoints(charset)
+
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        srs_out = srs.copy()
-        str_count = len(srs_out)
-
-        # get series of lengths of all strings in series
-        srs_str_out_len = srs_out.str.len()
-        # draw random values
-        arr_rng_vals = rng.random(size=str_count)
-        # compute indices from random values (+1 because letters can be inserted at the ned)
-        arr_rng_insert_indices = np.floor((srs_str_out_len + 1) * arr_rng_vals).astype(
-            int
-        )
+        str_count = len(srs)
+
+        # get array of lengths of all strings in series. missing values are never modified.
+        mask_notna = srs.notna().to_numpy()
+        arr_str_len = srs.str.len().to_numpy(dtype=int, na_value=0)
+        # draw random indices (+1 because letters can be inserted at the end)
+        arr_rng_insert_indices = rng.integers(0, arr_str_len + 1)
         # generate random char for each string
-        srs_rand_chars = pd.Series(
-            rng.choice(list(charset), size=str_count),
-            copy=False,  # use np array
-            index=srs_out.index,  # align index
+        arr_rand_codepoints = arr_charset_codepoints[
+            rng.integers(0, len(arr_charset_codepoints), size=str_count)
+        ]
+        # lay out strings as codepoint matrix with room for one more char
+        arr_codepoints = _series_to_char_matrix(srs, padding=1).view(np.uint32)
+        arr_col_indices = np.arange(arr_codepoints.shape[1])
+        # move all chars one position to the right. the first column is either written to by the line
+        # below or by the insertion.
+        arr_codepoints_out = np.empty_like(arr_codepoints)
+        arr_codepoints_out[:, 1:] = arr_codepoints[:, :-1]
+        # chars before the insert index stay in place
+        np.copyto(
+            arr_codepoints_out,
+            arr_codepoints,
+            where=arr_col_indices < arr_rng_insert_indices[:, np.newaxis],
         )
-        # determine all unique random indices
-        arr_uniq_idx = arr_rng_insert_indices.unique()
-
-        for i in arr_uniq_idx:
-            # select all strings with the same random insert index
-            srs_idx_mask = arr_rng_insert_indices == i
-            # insert character at current index
-            srs_out[srs_idx_mask] = (
-                srs_out[srs_idx_mask].str[:i]
-                + srs_rand_chars[srs_idx_mask]
-                + srs_out[srs_idx_mask].str[i:]
-            )
+        # insert character at selected index
+        arr_codepoints_out[
+            np.arange(str_count), arr_rng_insert_indices
+        ] = arr_rand_codepoints
+
+        # all strings except missing values are modified, so there is no need to copy the input series first
+        arr_str_out = _char_matrix_to_array(
+            arr_codepoints_out.view("U1"), arr_str_len + 1
+        )
+        mask_na = ~mask_notna
+        arr_str_out[mask_na] = srs.to_numpy(dtype=object)[mask_na]
 
-        return srs_out
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -773,34 +1078,39 @@ def with_delete(rng: Optional[np.random.Generator] = None) -> Mutator:
         rng = np.random.default_rng()
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        # get series of string lengths
-        srs_str_out_len = srs.str.len()
+        # get array of string lengths. missing values have a length of zero and are never modified.
+        arr_str_len = srs.str.len().to_numpy(dtype=int, na_value=0)
         # limit view to strings that have at least one character
-        srs_str_out_min_len = srs[srs_str_out_len >= 1]
+        mask_min_len = arr_str_len >= 1
+        arr_str_min_len = arr_str_len[mask_min_len]
 
         # check that there are any strings to modify
-        if len(srs_str_out_min_len) == 0:
+        if len(arr_str_min_len) == 0:
             return srs
 
-        # create copy after length check
-        srs_out = srs.copy()
         # generate random indices
-        arr_rng_vals = rng.random(size=len(srs_str_out_min_len))
-        arr_rng_delete_indices = np.floor(
-            srs_str_out_min_len.str.len() * arr_rng_vals
-        ).astype(int)
-        # determine unique indices
-        arr_uniq_idx = arr_rng_delete_indices.unique()
-
-        for i in arr_uniq_idx:
-            # select all strings with the same random delete index
-            srs_idx_mask = arr_rng_delete_indices == i
-            # delete character at selected index
-            srs_out.update(
-                srs_str_out_min_len[srs_idx_mask].str.slice_replace(i, i + 1, "")
-            )
+        arr_rng_delete_indices = rng.integers(0, arr_str_min_len)
+        # lay out strings as codepoint matrix
+        arr_codepoints = _series_to_char_matrix(srs[mask_min_len]).view(np.uint32)
+        arr_col_indices = np.arange(arr_codepoints.shape[1])
+        # move all chars one position to the left, leaving the last position empty
+        arr_codepoints_out = np.empty_like(arr_codepoints)
+        arr_codepoints_out[:, :-1] = arr_codepoints[:, 1:]
+        arr_codepoints_out[:, -1] = 0
+        # chars before the delete index stay in place
+        np.copyto(
+            arr_codepoints_out,
+            arr_codepoints,
+            where=arr_col_indices < arr_rng_delete_indices[:, np.newaxis],
+        )
 
-        return srs_out
+        # create copy only once the modified strings are ready to be written positionally
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[mask_min_len] = _char_matrix_to_array(
+            arr_codepoints_out.view("U1"), arr_str_min_len - 1
+        )
+
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -825,39 +1135,34 @@ def with_transpose(rng: Optional[np.random.Generator] = None) -> Mutator:
         rng = np.random.default_rng()
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        # length of strings
-        srs_str_out_len = srs.str.len()
+        # length of strings. missing values have a length of zero and are never modified.
+        arr_str_len = srs.str.len().to_numpy(dtype=int, na_value=0)
         # limit view to strings that have at least two characters
-        srs_str_out_min_len = srs[srs_str_out_len >= 2]
+        mask_min_len = arr_str_len >= 2
+        arr_str_min_len = arr_str_len[mask_min_len]
 
         # check that there are any strings to modify
-        if len(srs_str_out_min_len) == 0:
+        if len(arr_str_min_len) == 0:
             return srs
 
-        # create a copy only after running the length check
-        srs_out = srs.copy()
-        # generate random numbers
-        arr_rng_vals = rng.random(size=len(srs_str_out_min_len))
-
-        # -1 as neighboring char can be transposed
-        arr_rng_transpose_indices = np.floor(
-            (srs_str_out_min_len.str.len() - 1) * arr_rng_vals
-        ).astype(int)
-        # unique indices
-        arr_uniq_idx = arr_rng_transpose_indices.unique()
-
-        for i in arr_uniq_idx:
-            # select strings that have the same transposition
-            srs_idx_mask = arr_rng_transpose_indices == i
-            srs_masked = srs_str_out_min_len[srs_idx_mask]
-            srs_out.update(
-                srs_masked.str[:i]
-                + srs_masked.str[i + 1]
-                + srs_masked.str[i]
-                + srs_masked.str[i + 2 :]
-            )
+        # generate random indices. -1 as neighboring char can be transposed
+        arr_rng_transpose_indices = rng.integers(0, arr_str_min_len - 1)
+        # lay out strings as char matrix
+        arr_chars = _series_to_char_matrix(srs[mask_min_len])
+        arr_row_indices = np.arange(len(arr_chars))
+        # swap chars at the selected index and the index after it in place. fancy indexing returns a copy,
+        # so only the chars that are overwritten first need to be gathered.
+        arr_chars_left = arr_chars[arr_row_indices, arr_rng_transpose_indices]
+        arr_chars[arr_row_indices, arr_rng_transpose_indices] = arr_chars[
+            arr_row_indices, arr_rng_transpose_indices + 1
+        ]
+        arr_chars[arr_row_indices, arr_rng_transpose_indices + 1] = arr_chars_left
 
-        return srs_out
+        # create copy only once the modified strings are ready to be written positionally
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[mask_min_len] = _char_matrix_to_array(arr_chars, arr_str_min_len)
+
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -886,43 +1191,40 @@ def with_substitute(
     if rng is None:
         rng = np.random.default_rng()
 
+    # codepoints of chars to sample from
+    arr_charset_codepoints = _str_to_codepoints(charset)
+
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        # length of strings
-        srs_str_out_len = srs.str.len()
+        # length of strings. missing values have a length of zero and are never modified.
+        arr_str_len = srs.str.len().to_numpy(dtype=int, na_value=0)
         # limit view to strings that have at least 1 character
-        srs_str_out_min_len = srs[srs_str_out_len >= 1]
+        mask_min_len = arr_str_len >= 1
+        arr_str_min_len = arr_str_len[mask_min_len]
 
         # check that there are any strings to modify
-        if len(srs_str_out_min_len) == 0:
+        if len(arr_str_min_len) == 0:
             return srs
 
-        # create copy after length check
-        srs_out = srs.copy()
         # count strings that may be modified
-        str_count = len(srs_str_out_min_len)
+        str_count = len(arr_str_min_len)
         # random indices
-        arr_rng_vals = rng.random(size=str_count)
-        arr_rng_sub_indices = np.floor(
-            srs_str_out_min_len.str.len() * arr_rng_vals
-        ).astype(int)
+        arr_rng_sub_indices = rng.integers(0, arr_str_min_len)
         # random substitution chars
-        srs_rand_chars = pd.Series(
-            rng.choice(list(charset), size=str_count),
-            copy=False,  # use np array
-            index=srs_str_out_min_len.index,  # align index
-        )
-        arr_uniq_idx = arr_rng_sub_indices.unique()
-
-        for i in arr_uniq_idx:
-            srs_idx_mask = arr_rng_sub_indices == i
-            srs_masked = srs_str_out_min_len[srs_idx_mask]
-            srs_out.update(
-                srs_masked.str[:i]
-                + srs_rand_chars[srs_idx_mask]
-                + srs_masked.str[i + 1 :]
-            )
+        arr_rand_codepoints = arr_charset_codepoints[
+            rng.integers(0, len(arr_charset_codepoints), size=str_count)
+        ]
 
-        return srs_out
+        # lay out strings as char matrix and write the substitution chars as codepoints in a single scatter
+        arr_chars = _series_to_char_matrix(srs[mask_min_len])
+        arr_chars.view(np.uint32)[
+            np.arange(str_count), arr_rng_sub_indices
+        ] = arr_rand_codepoints
+
+        # create copy only once the modified strings are ready to be written positionally
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[mask_min_len] = _char_matrix_to_array(arr_chars, arr_str_min_len)
+
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -959,16 +1261,12 @@ def with_edit(
     if rng is None:
         rng = np.random.default_rng()
 
-    edit_ops: list[_EditOp] = ["ins", "del", "sub", "trs"]
     edit_ops_prob = [p_insert, p_delete, p_substitute, p_transpose]
 
     for p in edit_ops_prob:
         _check_probability_in_bounds(p)
 
-    try:
-        # sanity check
-        rng.choice(edit_ops, p=edit_ops_prob)
-    except ValueError:
+    if not _is_probability_sum_one(sum(edit_ops_prob)):
         raise ValueError("probabilities must sum up to 1.0")
 
     # equip every mutator with its own independent rng derived from this mutator's rng
@@ -980,34 +1278,24 @@ def with_edit(
         with_transpose(rng_trs),
     )
 
-    def _mutate_series(srs: pd.Series) -> pd.Series:
-        srs_out = srs.copy()
-        str_in_edit_ops = pd.Series(
-            rng.choice(edit_ops, size=len(srs_out), p=edit_ops_prob),
-            index=srs_out.index,
-        )
-
-        msk_ins = str_in_edit_ops == "ins"
-
-        if msk_ins.sum() != 0:
-            (srs_out[msk_ins],) = mut_ins([srs_out[msk_ins]])
-
-        msk_del = str_in_edit_ops == "del"
-
-        if msk_del.sum() != 0:
-            (srs_out[msk_del],) = mut_del([srs_out[msk_del]])
+    # mutators in the same order as their probabilities
+    edit_op_mutators = (mut_ins, mut_del, mut_sub, mut_trs)
 
-        msk_sub = str_in_edit_ops == "sub"
+    def _mutate_series(srs: pd.Series) -> pd.Series:
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        # assign each string the index of the edit operation to apply to it
+        arr_edit_op_idx = _draw_indices(rng, edit_ops_prob, len(srs)).astype(np.int8)
 
-        if msk_sub.sum() != 0:
-            (srs_out[msk_sub],) = mut_sub([srs_out[msk_sub]])
+        for k, mutator in enumerate(edit_op_mutators):
+            arr_row_pos = np.flatnonzero(arr_edit_op_idx == k)
 
-        msk_trs = str_in_edit_ops == "trs"
+            if len(arr_row_pos) == 0:
+                continue
 
-        if msk_trs.sum() != 0:
-            (srs_out[msk_trs],) = mut_trs([srs_out[msk_trs]])
+            (srs_mutated,) = mutator([srs.iloc[arr_row_pos]])
+            arr_str_out[arr_row_pos] = srs_mutated.to_numpy()
 
-        return srs_out
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -1031,6 +1319,46 @@ def with_noop() -> Mutator:
     return _mutate
 
 
+@cache_by_file()
+def _load_categorical_values(
+    csv_file_path: Union[PathLike, str],
+    value_column: Union[str, int],
+    encoding: str,
+    delimiter: str,
+) -> np.ndarray:
+    """
+    Read the unique values from a column within a CSV file. Results are cached, so the file is only parsed once
+    for each combination of arguments until it is modified. The returned array is read-only since it is shared
+    between all mutators that are created from the same arguments.
+
+    Args:
+        csv_file_path: path to CSV file
+        value_column: name or index of value column
+        encoding: character encoding of the CSV file
+        delimiter: column delimiter of the CSV file
+
+    Returns:
+        sorted array of unique values
+    """
+    header = isinstance(value_column, str)
+
+    # read csv file
+    df = pd.read_csv(
+        csv_file_path,
+        header=0 if header else None,
+        dtype=str,
+        usecols=[value_column],
+        sep=delimiter,
+        encoding=encoding,
+    )
+
+    # fetch unique values. they need to be sorted to ensure reproducibility.
+    arr_unique_values = np.sort(df[value_column].dropna().unique())
+    arr_unique_values.flags.writeable = False
+
+    return arr_unique_values
+
+
 def with_categorical_values(
     csv_file_path: Union[PathLike, str],
     value_column: Union[str, int] = 0,
@@ -1061,55 +1389,31 @@ def with_categorical_values(
     if not isinstance(value_column, str) and not isinstance(value_column, int):
         raise ValueError("value column must be either a string or an integer")
 
-    header = isinstance(value_column, str)
-
-    # read csv file
-    df = pd.read_csv(
-        csv_file_path,
-        header=0 if header else None,
-        dtype=str,
-        usecols=[value_column],
-        sep=delimiter,
-        encoding=encoding,
+    idx_unique_values = pd.Index(
+        _load_categorical_values(csv_file_path, value_column, encoding, delimiter)
     )
-
-    # fetch unique values
-    unique_values = pd.Series(df[value_column].dropna().unique())
+    unique_value_count = len(idx_unique_values)
 
     def _mutate_series(srs: pd.Series) -> pd.Series:
-        nonlocal unique_values
-
-        # create a new series with which the original one will be updated.
-        # for starters all rows will be NaN. dtype is to avoid typecast warning.
-        srs_in_update = pd.Series(
-            np.full(len(srs), np.nan), copy=False, dtype=str, index=srs.index
+        # look up the position of each string in the list of unique values. strings that are not
+        # one of the unique values are assigned -1 and are not modified.
+        arr_value_idx = idx_unique_values.get_indexer(srs)
+        mask_known_values = arr_value_idx != -1
+        arr_value_idx = arr_value_idx[mask_known_values]
+
+        # draw from all values except the current one by drawing from one value less and then skipping
+        # over the position of the current value
+        arr_new_value_idx = rng.integers(
+            0, unique_value_count - 1, size=len(arr_value_idx)
         )
+        arr_new_value_idx += arr_new_value_idx >= arr_value_idx
 
-        for unique_val in unique_values:
-            # remove current value from list of unique values
-            unique_vals_without_current = np.setdiff1d(unique_values, unique_val)
-            # select all rows that equal the current value
-            srs_in_matching_val = srs.str.fullmatch(unique_val)
-            # count the rows that contain the current value
-            unique_val_total = srs_in_matching_val.sum()
-
-            # skip if there are no values to generate
-            if unique_val_total == 0:
-                continue
-
-            # draw from the list of values excluding the current one
-            new_unique_vals = rng.choice(
-                unique_vals_without_current, size=unique_val_total
-            )
-
-            # populate the series that is used for updating the original one
-            srs_in_update[srs_in_matching_val] = new_unique_vals
-
-        # update() is performed in-place, so create a copy of the initial series first.
-        srs_out = srs.copy()
-        srs_out.update(srs_in_update)
+        arr_str_out = srs.to_numpy(dtype=object, copy=True)
+        arr_str_out[mask_known_values] = idx_unique_values.to_numpy(dtype=object)[
+            arr_new_value_idx
+        ]
 
-        return srs_out
+        return _new_series_like(arr_str_out, srs)
 
     def _mutate(srs_lst: list[pd.Series]) -> list[pd.Series]:
         return [_mutate_series(srs) for srs in srs_lst]
@@ -1155,30 +1459,17 @@ def with_permute(rng: Optional[np.random.Generator] = None) -> Mutator:
         )
         # choose random index permutations
         arr_rand_idx_tpl = rng.choice(srs_idx_permutations, size=srs_0_len)
-        # map tuples to each series
-        srs_idx_per_srs = list(zip(*arr_rand_idx_tpl))
-        # transform each list of indices into series
-        srs_lst_idx_per_srs = [
-            pd.Series(
-                data=srs_idx_per_srs[i],
-                index=srs_lst[i].index,
-                copy=False,
-            )
-            for i in range(srs_lst_len)
+        # map tuples to each series. row i holds the index of the series to take each value from.
+        arr_idx_per_srs = np.asarray(arr_rand_idx_tpl).T
+        # lay out values of all series as rows of a matrix to gather from
+        arr_values = np.stack([srs.to_numpy(dtype=object) for srs in srs_lst])
+        arr_col_indices = np.arange(srs_0_len)
+
+        return [
+            _new_series_like(arr_values[arr_idx_per_srs[i], arr_col_indices], srs)
+            for i, srs in enumerate(srs_lst)
         ]
 
-        srs_lst_out = [srs.copy() for srs in srs_lst]
-
-        for i in range(srs_lst_len):
-            for j in range(srs_lst_len):
-                if i == j:
-                    continue
-
-                mask_this_srs = srs_lst_idx_per_srs[i] == j
-                srs_lst_out[i][mask_this_srs] = srs_lst[j][mask_this_srs]
-
-        return srs_lst_out
-
     return _mutate
 
 
@@ -1221,7 +1512,10 @@ def mutate_data_frame(
     if rng is None:
         rng = np.random.default_rng()
 
-    df_out = df_in.copy()
+    # only columns that are mutated are copied. all other columns are shared with the input data frame.
+    df_out = df_in.copy(deep=False)
+    # track columns that have been copied already
+    copied_column_names: set[str] = set()
 
     for column_spec, mutator_spec in column_to_mutator_dict.items():
         # convert to list if there is only one column specified
@@ -1266,42 +1560,65 @@ def mutate_data_frame(
         p_values, mutator_funcs = list(zip(*mutator_spec))
         p_sum = sum(p_values)
 
-        if p_sum > 1:
+        p_sum_is_one = _is_probability_sum_one(p_sum)
+
+        if p_sum > 1 and not p_sum_is_one:
             raise ValueError(
                 f"sum of probabilities may not be higher than 1.0, is {p_sum}"
             )
 
         # pad probabilities to sum up to 1.0
-        if p_sum < 1:
+        if p_sum < 1 and not p_sum_is_one:
             p_values = (*p_values, 1 - p_sum)
             mutator_funcs = (*mutator_funcs, with_noop())
 
-        try:
-            # sanity check
-            rng.choice([i for i in range(len(p_values))], p=p_values)
-        except ValueError:
+        # sanity check without drawing from the rng, which would change all subsequently drawn numbers
+        if any(p < 0 for p in p_values) or not _is_probability_sum_one(sum(p_values)):
             column_str = f"column{'s' if len(column_spec) > 1 else ''} `{', '.join(column_spec)}`"
             raise ValueError(f"probabilities for {column_str} must sum up to 1.0")
 
-        mutator_count = len(mutator_funcs)
-        # generate a series where each row gets an index of the mutator in mutator_funcs to apply.
-        arr_mutator_idx = np.arange(mutator_count)
-        arr_mutator_per_row = rng.choice(arr_mutator_idx, p=p_values, size=len(df_out))
-        srs_mutator_idx = pd.Series(data=arr_mutator_per_row, index=df_out.index)
+        # generate an array where each row gets an index of the mutator in mutator_funcs to apply.
+        arr_mutator_per_row = _draw_indices(rng, p_values, len(df_out))
+        # group row positions by the mutator that is applied to them
+        mutator_idx_to_row_pos_dict = (
+            pd.Series(arr_mutator_per_row).groupby(arr_mutator_per_row).indices
+        )
+
+        # copy columns before writing to them for the first time
+        for column_name in column_spec:
+            if column_name not in copied_column_names:
+                df_out[column_name] = df_out[column_name].copy()
+                copied_column_names.add(column_name)
+
         srs_columns = [df_out[column_name] for column_name in column_spec]
+        column_positions = [
+            df_out.columns.get_loc(column_name) for column_name in column_spec
+        ]
 
-        for i in arr_mutator_idx:
+        for i in sorted(mutator_idx_to_row_pos_dict.keys()):
             mutator = mutator_funcs[i]
-            mask_this_mutator = srs_mutator_idx == i
-            srs_mutated_lst = mutator([srs[mask_this_mutator] for srs in srs_columns])
+            arr_row_pos = mutator_idx_to_row_pos_dict[i]
+            srs_mutated_lst = mutator([srs.iloc[arr_row_pos] for srs in srs_columns])
 
-            # i would've liked to use .loc[mask_this_mutator, column_spec] = mutator(...) here
-            # but there is apparently a shape mismatch that happens here. so instead i'm manually
-            # iterating over each mutated series until i find a better solution.
-            for j in range(len(column_spec)):
-                column_name = column_spec[j]
-                srs_mutated = srs_mutated_lst[j]
-
-                df_out.loc[mask_this_mutator, column_name] = srs_mutated
+            # write mutated values positionally, since rows have been selected by position
+            for column_pos, srs_mutated in zip(column_positions, srs_mutated_lst):
+                df_out.iloc[arr_row_pos, column_pos] = srs_mutated.to_numpy()
 
     return df_out
+
+
+def clear_cache():
+    """
+    Discard all files that have been read by mutators that load their data from files.
+    This applies to `with_categorical_values`, `with_cldr_keymap_file`, `with_phonetic_replacement_table` and
+    `with_replacement_table`.
+    Modified files are read again without clearing the cache, so this is only needed to free memory.
+    Mutators that have already been created keep using the data they were created with.
+    """
+    for load_fn in (
+        _load_kb_tables,
+        _load_phonetic_replacement_rules,
+        _load_replacement_table,
+        _load_categorical_values,
+    ):
+        load_fn.cache_clear()
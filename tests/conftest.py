@@ -1,11 +1,13 @@
 import json
 import os.path
+import string
 import time
 import timeit
 from datetime import datetime, timezone
 from typing import Callable, Optional
 
 import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -14,6 +16,19 @@ def rng():
     return np.random.default_rng(727)
 
 
+@pytest.fixture()
+def random_str_series(rng):
+    # function-scoped on top of the rng fixture so that generated series don't depend on which tests ran before
+    arr_chars = np.array(list(string.printable))
+
+    def __random_str_series(count: int, str_len: int = 20) -> pd.Series:
+        # draw a matrix of chars and view each row as a single string
+        arr_char_idx = rng.integers(0, len(arr_chars), size=(count, str_len))
+        return pd.Series(arr_chars[arr_char_idx].view(f"U{str_len}").ravel())
+
+    return __random_str_series
+
+
 @pytest.fixture(scope="session")
 def benchmark():
     bench_output_directory = os.path.join(os.path.dirname(__file__), "benchmark-report")
@@ -1,4 +1,5 @@
-import numpy as np
+import itertools
+
 import pandas as pd
 import pytest
 
@@ -7,21 +8,35 @@ from tests.helpers import get_asset_path
 
 
 def test_from_function():
-    flag = False
-
-    def _generator() -> str:
-        nonlocal flag
-        flag = not flag
-
-        return "foo" if flag else "bar"
-
-    generate_foobar = generator.from_function(_generator)
+    # alternate between two values without keeping state in a closure
+    generate_foobar = generator.from_function(next, itertools.cycle(["foo", "bar"]))
     foobar_list = generate_foobar(4)
 
     assert len(foobar_list) == 1
     assert foobar_list[0].equals(pd.Series(["foo", "bar", "foo", "bar"]))
 
 
+def test_from_vectorized_function():
+    def _generator(prefix: str, size: int) -> list[str]:
+        return [f"{prefix}{i}" for i in range(size)]
+
+    generate_foo = generator.from_vectorized_function(_generator, "foo")
+    foo_list = generate_foo(3)
+
+    assert len(foo_list) == 1
+    assert foo_list[0].equals(pd.Series(["foo0", "foo1", "foo2"]))
+
+
+def test_from_vectorized_function_numpy(rng):
+    generate_letters = generator.from_vectorized_function(
+        rng.choice, list("abc"), count_arg="size"
+    )
+    (srs_letters,) = generate_letters(100)
+
+    assert len(srs_letters) == 100
+    assert srs_letters.isin(["a", "b", "c"]).all()
+
+
 def test_from_uniform_distribution(rng):
     generate_uniform = generator.from_uniform_distribution(1, 10, rng=rng)
     number_list = generate_uniform(1000)
@@ -29,7 +44,7 @@ def test_from_uniform_distribution(rng):
     assert len(number_list) == 1
     assert len(number_list[0]) == 1000
 
-    numbers_as_floats = np.array([float(n) for n in number_list[0]], dtype=float)
+    numbers_as_floats = number_list[0].to_numpy(dtype=float)
 
     assert (numbers_as_floats >= 1).all()
     assert (numbers_as_floats <= 10).all()
@@ -97,6 +112,23 @@ def test_from_frequency_table(rng):
     assert sorted(srs.unique()) == ["apple", "banana", "orange"]
 
 
+def test_from_frequency_table_file_modified(tmp_path, rng):
+    csv_file_path = tmp_path / "freq.csv"
+    csv_file_path.write_text("foo,1\n", encoding="utf-8")
+    gen_foo = generator.from_frequency_table(csv_file_path, rng=rng)
+
+    # the modified file must be read again instead of reusing the cached table
+    csv_file_path.write_text("quux,1\n", encoding="utf-8")
+    gen_quux = generator.from_frequency_table(csv_file_path, rng=rng)
+
+    assert gen_foo(3)[0].tolist() == ["foo"] * 3
+    assert gen_quux(3)[0].tolist() == ["quux"] * 3
+
+    # generators that have already been created are not affected by clearing the cache
+    generator.clear_cache()
+    assert gen_foo(3)[0].tolist() == ["foo"] * 3
+
+
 def test_from_multicolumn_frequency_table(rng):
     gen_fruit_types = generator.from_multicolumn_frequency_table(
         get_asset_path("freq-fruits-types.csv"),
@@ -112,18 +144,19 @@ def test_from_multicolumn_frequency_table(rng):
     assert len(srs_fruit) == 100
     assert len(srs_type) == 100
 
-    for i in range(100):
-        fruit = srs_fruit.iloc[i]
-        fruit_type = srs_type.iloc[i]
-
-        if fruit == "apple":
-            assert fruit_type in ("braeburn", "elstar")
-        elif fruit == "banana":
-            assert fruit_type in ("cavendish", "plantain")
-        elif fruit == "orange":
-            assert fruit_type in ("clementine", "mandarin")
-        else:
-            raise AssertionError(f"unknown fruit: `{fruit}`")
+    # check that each fruit is only paired with its own types
+    srs_fruit_by_type = srs_type.map(
+        {
+            "braeburn": "apple",
+            "elstar": "apple",
+            "cavendish": "banana",
+            "plantain": "banana",
+            "clementine": "orange",
+            "mandarin": "orange",
+        }
+    )
+
+    assert (srs_fruit == srs_fruit_by_type).all()
 
 
 def test_to_dataframe_error_empty_dict():
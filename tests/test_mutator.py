@@ -18,80 +18,127 @@ from gecko.mutator import (
     mutate_data_frame,
     with_noop,
     with_function,
+    with_vectorized_function,
     with_permute,
+    clear_cache,
     Mutator,
 )
 from tests.helpers import get_asset_path
 
 
+# series shared by several tests. mutators never modify their inputs (see test_mutator_no_modify), so these
+# can be reused safely.
+_SRS_FOOBARBAZ = pd.Series(["foo", "bar", "baz"])
+_SRS_MISSING_VALUES = pd.Series(["foo", "   ", ""])
+
+
 def test_with_function(rng):
     # basic mutator that simply adds a random number from 0 to 9
     def _mutator(value: str, rand) -> str:
         return value + str(rand.integers(0, 9))
 
-    srs = pd.Series(["foo", "bar", "baz"])
+    srs = _SRS_FOOBARBAZ
     mutate_ints = with_function(_mutator, rand=rng)
     (srs_mutated,) = mutate_ints([srs])
 
-    for i in range(len(srs)):
-        x_orig, x_mut = srs.iloc[i], srs_mutated.iloc[i]
+    assert (srs != srs_mutated).all()
+    assert (srs_mutated.str.len() == srs.str.len() + 1).all()
+    assert srs_mutated.str[-1].isin(tuple(string.digits)).all()
+
+
+def test_with_vectorized_function(rng):
+    # same as above, but the random numbers are drawn for all values at once
+    def _mutator(srs: pd.Series, rand) -> pd.Series:
+        return srs + rand.integers(0, 9, size=len(srs)).astype(str)
 
-        assert x_orig != x_mut
-        assert len(x_mut) == len(x_orig) + 1
-        assert x_mut[-1:] in string.digits
+    srs = _SRS_FOOBARBAZ
+    mutate_ints = with_vectorized_function(_mutator, rand=rng)
+    (srs_mutated,) = mutate_ints([srs])
+
+    assert (srs != srs_mutated).all()
+    assert (srs_mutated.str.len() == srs.str.len() + 1).all()
+    assert srs_mutated.str[-1].isin(tuple(string.digits)).all()
+
+
+def test_with_vectorized_function_raise_length_mismatch():
+    mutate_head = with_vectorized_function(lambda srs: srs.head(1))
+
+    with pytest.raises(ValueError) as e:
+        mutate_head([pd.Series(["foo", "bar"])])
+
+    assert str(e.value) == "function must return 2 values, got array of shape (1,)"
 
 
 def test_with_value_replace_all():
-    srs = pd.Series(["foo", "   ", ""])
+    srs = _SRS_MISSING_VALUES
     mutate_missing = with_missing_value("bar", "all")
     (srs_mutated,) = mutate_missing([srs])
 
-    assert (srs_mutated == pd.Series(["bar", "bar", "bar"])).all()
+    assert srs_mutated.equals(pd.Series(["bar", "bar", "bar"]))
 
 
 def test_with_value_replace_empty():
-    srs = pd.Series(["foo", "   ", ""])
+    srs = _SRS_MISSING_VALUES
     mutate_missing = with_missing_value("bar", "empty")
     (srs_mutated,) = mutate_missing([srs])
 
-    assert (srs_mutated == pd.Series(["foo", "   ", "bar"])).all()
+    assert srs_mutated.equals(pd.Series(["foo", "   ", "bar"]))
 
 
 def test_with_value_replace_blank():
-    srs = pd.Series(["foo", "   ", ""])
+    srs = _SRS_MISSING_VALUES
     mutate_missing = with_missing_value("bar", "blank")
     (srs_mutated,) = mutate_missing([srs])
 
-    assert (srs_mutated == pd.Series(["foo", "bar", "bar"])).all()
+    assert srs_mutated.equals(pd.Series(["foo", "bar", "bar"]))
+
+
+@pytest.mark.parametrize("strategy", ["blank", "empty"])
+def test_with_value_replace_keep_missing_values(strategy: str):
+    srs = pd.Series(["foo", pd.NA, ""], dtype="string")
+    mutate_missing = with_missing_value("bar", strategy)
+    (srs_mutated,) = mutate_missing([srs])
+
+    assert srs_mutated.iloc[0] == "foo"
+    assert srs_mutated.iloc[1] is pd.NA
+    assert srs_mutated.iloc[2] == "bar"
 
 
 def test_with_random_insert(rng):
-    srs = pd.Series(["foo", "bar", "baz"])
+    srs = _SRS_FOOBARBAZ
     mutate_insert = with_insert(charset="x", rng=rng)
     (srs_mutated,) = mutate_insert([srs])
 
     # check that series are of the same length
     assert len(srs) == len(srs_mutated)
     # check that all strings are different from one another
-    assert ~(srs == srs_mutated).all()
+    assert (srs != srs_mutated).any()
 
     # check that all string pairs are different in only one char
-    for i in range(len(srs)):
-        assert len(srs.iloc[i]) + 1 == len(srs_mutated.iloc[i])
-        # check that this char is the `x`
-        assert "x" not in srs.iloc[i]
-        assert "x" in srs_mutated.iloc[i]
+    assert (srs.str.len() + 1 == srs_mutated.str.len()).all()
+    # check that this char is the `x`
+    assert (~srs.str.contains("x", regex=False)).all()
+    assert srs_mutated.str.contains("x", regex=False).all()
+
+
+def test_with_random_insert_charset_list(rng):
+    srs = _SRS_FOOBARBAZ
+    mutate_insert = with_insert(charset=list("xyz"), rng=rng)
+    (srs_mutated,) = mutate_insert([srs])
+
+    assert (srs_mutated.str.len() == srs.str.len() + 1).all()
+    assert srs_mutated.str.contains("[xyz]").all()
 
 
 def test_with_random_delete(rng):
-    srs = pd.Series(["foo", "bar", "baz"])
+    srs = _SRS_FOOBARBAZ
     mutate_delete = with_delete(rng=rng)
     (srs_mutated,) = mutate_delete([srs])
 
     # check that series are of the same length
     assert len(srs) == len(srs_mutated)
     # check that all strings are different from one another
-    assert ~(srs == srs_mutated).all()
+    assert (srs != srs_mutated).any()
     # check that all string pairs are different in one char
     assert ((srs.str.len() - 1) == srs_mutated.str.len()).all()
 
@@ -113,13 +160,14 @@ def test_with_random_transpose(rng):
     # same lengths
     assert len(srs) == len(srs_mutated)
     # all different
-    assert ~(srs == srs_mutated).all()
+    assert (srs != srs_mutated).any()
     # same string lengths
-    assert (srs.str.len() == srs_mutated.str.len()).all()
+    assert np.array_equal(srs.str.len().to_numpy(), srs_mutated.str.len().to_numpy())
 
-    # check that the characters are the same in both series
-    for i in range(len(srs)):
-        assert set(srs.iloc[i]) == set(srs_mutated.iloc[i])
+    # check that the characters are the same in both series by comparing sorted char matrices
+    arr_chars = srs.to_numpy(dtype="U3").view("U1").reshape(-1, 3)
+    arr_chars_mutated = srs_mutated.to_numpy(dtype="U3").view("U1").reshape(-1, 3)
+    assert (np.sort(arr_chars, axis=1) == np.sort(arr_chars_mutated, axis=1)).all()
 
 
 def test_with_random_transpose_no_neighbor(rng):
@@ -130,25 +178,30 @@ def test_with_random_transpose_no_neighbor(rng):
     # same lengths
     assert len(srs) == len(srs_mutated)
     # none transposed except last
-    assert (srs_mutated == ["", "a", "ba"]).all()
+    assert srs_mutated.equals(pd.Series(["", "a", "ba"]))
 
 
 def test_with_random_substitute(rng):
-    srs = pd.Series(["foo", "bar", "baz"])
+    srs = _SRS_FOOBARBAZ
     mutate_substitute = with_substitute(charset="x", rng=rng)
     (srs_mutated,) = mutate_substitute([srs])
 
     # same len
     assert len(srs) == len(srs_mutated)
     # all different
-    assert ~(srs == srs_mutated).all()
+    assert (srs != srs_mutated).any()
     # same string lengths
-    assert (srs.str.len() == srs_mutated.str.len()).all()
+    assert np.array_equal(srs.str.len().to_numpy(), srs_mutated.str.len().to_numpy())
 
+    # lay out strings as char matrices
+    arr_chars = srs.to_numpy(dtype="U3").view("U1").reshape(-1, 3)
+    arr_chars_mutated = srs_mutated.to_numpy(dtype="U3").view("U1").reshape(-1, 3)
+    # check that exactly one char is different in every string
+    assert ((arr_chars != arr_chars_mutated).sum(axis=1) == 1).all()
     # check that original doesn't contain x
-    assert (~srs.str.contains("x")).all()
+    assert not (arr_chars == "x").any()
     # check that mutated copy contains x
-    assert srs_mutated.str.contains("x").all()
+    assert (arr_chars_mutated == "x").any(axis=1).all()
 
 
 def test_with_random_substitute_empty_string(rng):
@@ -158,41 +211,74 @@ def test_with_random_substitute_empty_string(rng):
 
     # same len
     assert len(srs) == len(srs_mutated)
-    assert (srs_mutated == ["", "x"]).all()
+    assert srs_mutated.equals(pd.Series(["", "x"]))
 
 
-def test_with_categorical_values(rng):
-    def _generate_gender_list():
-        nonlocal rng
-        return rng.choice(["m", "f", "d", "x"], size=1000)
+def test_trailing_nul_chars(rng):
+    srs = pd.Series(["a\x00\x00", "\x00", "ab\x00"])
+
+    for mutate, str_len_delta in (
+        (with_insert(charset="\x00", rng=rng), 1),
+        (with_delete(rng=rng), -1),
+        (with_transpose(rng=rng), 0),
+        (with_substitute(charset="\x00", rng=rng), 0),
+        (with_cldr_keymap_file(get_asset_path("de-t-k0-windows.xml"), rng=rng), 0),
+    ):
+        (srs_mutated,) = mutate([srs])
+
+        # trailing NUL chars must not be dropped from mutated strings
+        assert (srs_mutated.str.len() == srs.str.len() + str_len_delta).all()
 
+    (srs_mutated,) = with_delete(rng=rng)([pd.Series(["\x00\x00"])])
+    assert srs_mutated.tolist() == ["\x00"]
+
+
+def test_with_categorical_values(rng):
     mutate_categorical = with_categorical_values(
         get_asset_path("freq_table_gender.csv"),
         value_column="gender",
         rng=rng,
     )
 
-    srs = pd.Series(_generate_gender_list())
+    # draw indices into a byte array of categories, same as for the edit test strings
+    arr_categories = np.array(["m", "f", "d", "x"], dtype="S1")
+    srs = pd.Series(
+        arr_categories[rng.integers(0, len(arr_categories), size=1000)].astype(str)
+    )
     (srs_mutated,) = mutate_categorical([srs])
 
     # same length
     assert len(srs) == len(srs_mutated)
     # different items
-    assert ~(srs == srs_mutated).all()
+    assert (srs != srs_mutated).any()
 
 
-def test_with_edit(rng):
-    def _new_string():
-        nonlocal rng
-        chars = list(string.ascii_letters)
-        rng.shuffle(chars)
-        return "".join(chars[:10])
+def test_with_categorical_values_file_modified(tmp_path, rng):
+    csv_file_path = tmp_path / "values.csv"
+    csv_file_path.write_text("a\nb\n", encoding="utf-8")
+    srs = pd.Series(["a"] * 10)
+    mutate_b = with_categorical_values(csv_file_path, rng=rng)
+
+    # the modified file must be read again instead of reusing the cached values
+    csv_file_path.write_text("a\ncd\n", encoding="utf-8")
+    mutate_cd = with_categorical_values(csv_file_path, rng=rng)
+    # mutators that have already been created are not affected by clearing the cache
+    clear_cache()
+
+    (srs_mutated_b,) = mutate_b([srs])
+    (srs_mutated_cd,) = mutate_cd([srs])
+
+    assert (srs_mutated_b == "b").all()
+    assert (srs_mutated_cd == "cd").all()
 
-    def _generate_strings():
-        nonlocal rng
-        return [_new_string() for _ in range(1000)]
 
-    srs = pd.Series(_generate_strings())
+def test_with_edit(rng):
+    # draw 1000 strings with 10 distinct random letters each by viewing rows of chars as fixed-width strings
+    arr_chars = np.frombuffer(string.ascii_letters.encode(), dtype="S1")
+    arr_char_idx = np.argpartition(rng.random((1000, len(arr_chars))), 10, axis=1)[
+        :, :10
+    ]
+    srs = pd.Series(arr_chars[arr_char_idx].view("S10").ravel().astype(str))
     mutate_edit = with_edit(
         p_insert=0.25,
         p_delete=0.25,
@@ -204,7 +290,7 @@ def test_with_edit(rng):
     (srs_mutated,) = mutate_edit([srs])
 
     assert len(srs) == len(srs_mutated)
-    assert ~(srs == srs_mutated).all()
+    assert (srs != srs_mutated).any()
 
 
 def test_with_edit_incorrect_probabilities():
@@ -214,6 +300,21 @@ def test_with_edit_incorrect_probabilities():
     assert str(e.value) == "probabilities must sum up to 1.0"
 
 
+def test_with_edit_rounded_probabilities(rng):
+    srs = _SRS_FOOBARBAZ
+    # probabilities that don't sum up to exactly 1.0 due to rounding must be accepted
+    mutate_edit = with_edit(
+        p_insert=0.25,
+        p_delete=0.25,
+        p_substitute=0.25,
+        p_transpose=0.24999999,
+        rng=rng,
+    )
+    (srs_mutated,) = mutate_edit([srs])
+
+    assert len(srs) == len(srs_mutated)
+
+
 def test_with_phonetic_replacement_table(rng):
     df_phonetic_in_out = pd.read_csv(get_asset_path("phonetic-test.csv"))
     srs_original = df_phonetic_in_out["original"]
@@ -227,17 +328,58 @@ def test_with_phonetic_replacement_table(rng):
     assert (srs_mutated_actual == srs_mutated_expected).all()
 
 
+def test_with_phonetic_replacement_table_missing_values(rng):
+    srs = pd.Series(["strasse", pd.NA, "statt", pd.NA], dtype="string")
+    mutate_phonetic = with_phonetic_replacement_table(
+        get_asset_path("homophone-de.csv"), rng=rng
+    )
+    (srs_mutated,) = mutate_phonetic([srs])
+
+    assert srs_mutated.isna().to_numpy().tolist() == [False, True, False, True]
+
+
 def test_with_cldr_keymap_file(rng):
     srs = pd.Series(["d", "e"])
     mutate_cldr = with_cldr_keymap_file(get_asset_path("de-t-k0-windows.xml"), rng=rng)
     (srs_mutated,) = mutate_cldr([srs])
 
     assert len(srs) == len(srs_mutated)
-    assert (srs.str.len() == srs_mutated.str.len()).all()
-    assert ~(srs == srs_mutated).all()
+    assert np.array_equal(srs.str.len().to_numpy(), srs_mutated.str.len().to_numpy())
+    assert (srs != srs_mutated).any()
+
+    arr_mutated = srs_mutated.to_numpy()
+    assert arr_mutated[0] in frozenset("Decsf")  # neighboring keys of `d`
+    assert arr_mutated[1] in frozenset("E3dwr")  # neighboring keys of `e`
+
+
+def test_with_cldr_keymap_file_missing_values(rng):
+    srs = pd.Series(["d", None, np.nan, "e"])
+    mutate_cldr = with_cldr_keymap_file(get_asset_path("de-t-k0-windows.xml"), rng=rng)
+    (srs_mutated,) = mutate_cldr([srs])
+
+    # missing values must be passed through as-is instead of being mutated like strings
+    assert srs_mutated.iloc[1] is None
+    assert np.isnan(srs_mutated.iloc[2])
+
+    arr_mutated = srs_mutated.to_numpy()
+    assert arr_mutated[0] in frozenset("Decsf")
+    assert arr_mutated[3] in frozenset("E3dwr")
+
+
+def test_with_cldr_keymap_file_reuse():
+    srs = pd.Series(["d", "e"] * 50)
+    # both mutators share the same cached keymap tables, so mutating with one mustn't affect the other
+    mutate_cldr_1 = with_cldr_keymap_file(
+        get_asset_path("de-t-k0-windows.xml"), rng=np.random.default_rng(727)
+    )
+    mutate_cldr_2 = with_cldr_keymap_file(
+        get_asset_path("de-t-k0-windows.xml"), rng=np.random.default_rng(727)
+    )
+
+    (srs_mutated_1,) = mutate_cldr_1([srs])
+    (srs_mutated_2,) = mutate_cldr_2([srs])
 
-    assert srs_mutated.iloc[0] in "Decsf"  # neighboring keys of `d`
-    assert srs_mutated.iloc[1] in "E3dwr"  # neighboring keys of `e`
+    assert srs_mutated_1.equals(srs_mutated_2)
 
 
 def test_with_cldr_keymap_file_and_charset(rng):
@@ -251,10 +393,24 @@ def test_with_cldr_keymap_file_and_charset(rng):
     (srs_mutated,) = mutate_cldr([srs])
 
     assert len(srs) == len(srs_mutated)
-    assert (srs.str.len() == srs_mutated.str.len()).all()
+    assert np.array_equal(srs.str.len().to_numpy(), srs_mutated.str.len().to_numpy())
 
-    assert srs_mutated.iloc[0] in "35"
-    assert srs_mutated.iloc[1] == "e"
+    arr_mutated = srs_mutated.to_numpy()
+    assert arr_mutated[0] in frozenset("35")
+    assert arr_mutated[1] == "e"
+
+
+@pytest.mark.parametrize("charset", [list(string.digits), set(string.digits)])
+def test_with_cldr_keymap_file_and_charset_collection(charset, rng):
+    srs = pd.Series(["4", "e"])
+    mutate_cldr = with_cldr_keymap_file(
+        get_asset_path("de-t-k0-windows.xml"), charset=charset, rng=rng
+    )
+    (srs_mutated,) = mutate_cldr([srs])
+
+    arr_mutated = srs_mutated.to_numpy()
+    assert arr_mutated[0] in frozenset("35")
+    assert arr_mutated[1] == "e"
 
 
 def test_with_cldr_keymap_file_no_replacement(rng):
@@ -264,7 +420,7 @@ def test_with_cldr_keymap_file_no_replacement(rng):
     (srs_mutated,) = mutate_cldr([srs])
 
     assert len(srs) == len(srs_mutated)
-    assert (srs.str.len() == srs_mutated.str.len()).all()
+    assert np.array_equal(srs.str.len().to_numpy(), srs_mutated.str.len().to_numpy())
     assert (srs == srs_mutated).all()
 
 
@@ -277,6 +433,83 @@ def test_with_replacement_table(rng):
     assert (srs != srs_mutated).all()
 
 
+def test_with_replacement_table_missing_values(rng):
+    srs = pd.Series(["k", pd.NA, "5", pd.NA], dtype="string")
+    mutate_replacement = with_replacement_table(get_asset_path("ocr.csv"), rng=rng)
+    (srs_mutated,) = mutate_replacement([srs])
+
+    assert srs_mutated.isna().to_numpy().tolist() == [False, True, False, True]
+    assert (srs_mutated[srs.notna()] != srs[srs.notna()]).all()
+
+    # a series without any strings must not fail either
+    (srs_mutated,) = mutate_replacement([pd.Series([None, None])])
+    assert srs_mutated.isna().all()
+
+
+def test_with_replacement_table_pyarrow(monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    srs = pd.Series(["kick 0", "step 1", None, "go 2", "run 5"] * 10)
+
+    def _mutate_replacement(srs_lst: list[pd.Series]) -> list[pd.Series]:
+        mutate = with_replacement_table(
+            get_asset_path("ocr.csv"), rng=np.random.default_rng(6379)
+        )
+        return mutate(srs_lst)
+
+    # substring checks run on pyarrow-backed strings if pyarrow is installed. results must be the same without it.
+    (srs_mutated_pyarrow,) = _mutate_replacement([srs])
+    monkeypatch.setattr("gecko.mutator._has_pyarrow", False)
+    (srs_mutated_python,) = _mutate_replacement([srs])
+
+    assert srs_mutated_pyarrow.equals(srs_mutated_python)
+    assert (srs_mutated_pyarrow[srs.notna()] != srs[srs.notna()]).any()
+    assert srs_mutated_pyarrow.isna().equals(srs.isna())
+
+
+def test_with_replacement_table_empty(tmp_path, rng):
+    csv_file_path = tmp_path / "repl.csv"
+    csv_file_path.write_text("source,target\n", encoding="utf-8")
+    srs = pd.Series(["a", "b", None])
+    mutate_replacement = with_replacement_table(
+        csv_file_path, source_column="source", target_column="target", rng=rng
+    )
+    (srs_mutated,) = mutate_replacement([srs])
+
+    assert srs_mutated.equals(srs)
+
+
+def test_with_replacement_table_file_modified(tmp_path, rng):
+    csv_file_path = tmp_path / "repl.csv"
+    csv_file_path.write_text("a,b\n", encoding="utf-8")
+    srs = pd.Series(["a"] * 10)
+    (srs_mutated_b,) = with_replacement_table(csv_file_path, rng=rng)([srs])
+
+    # the modified file must be read again instead of reusing the cached table
+    csv_file_path.write_text("a,cd\n", encoding="utf-8")
+    (srs_mutated_cd,) = with_replacement_table(csv_file_path, rng=rng)([srs])
+
+    assert (srs_mutated_b == "b").all()
+    assert (srs_mutated_cd == "cd").all()
+
+
+def test_with_replacement_table_relative_path(tmp_path, monkeypatch, rng):
+    for dir_name, target in (("b", "b"), ("c", "c")):
+        (tmp_path / dir_name).mkdir()
+        (tmp_path / dir_name / "repl.csv").write_text(f"a,{target}\n", encoding="utf-8")
+
+    srs = pd.Series(["a"] * 10)
+
+    # the same relative path points to different files depending on the working directory
+    monkeypatch.chdir(tmp_path / "b")
+    (srs_mutated_b,) = with_replacement_table("repl.csv", rng=rng)([srs])
+    monkeypatch.chdir(tmp_path / "c")
+    (srs_mutated_c,) = with_replacement_table("repl.csv", rng=rng)([srs])
+
+    assert (srs_mutated_b == "b").all()
+    assert (srs_mutated_c == "c").all()
+
+
 def test_with_replacement_table_multiple_options(rng):
     # `q` has more than one mapping in the replacement table, so running
     # 100 q's through the mutator should yield different results
@@ -401,6 +634,41 @@ def test_mutate_data_frame_probability_sum_too_high():
     assert str(e.value) == "sum of probabilities may not be higher than 1.0, is 1.1"
 
 
+def test_mutate_data_frame_rounded_probabilities(rng):
+    df_in = pd.DataFrame(data={"foo": ["a"] * 100})
+    # these probabilities sum up to slightly more than 1.0 due to rounding
+    df_out = mutate_data_frame(
+        df_in,
+        {
+            "foo": [
+                (0.33333334, with_noop()),
+                (0.33333333, with_noop()),
+                (0.33333334, with_missing_value("b", "all")),
+            ]
+        },
+        rng=rng,
+    )
+
+    assert (df_out["foo"] == "b").any()
+
+
+def test_mutate_data_frame_negative_probability():
+    df = pd.DataFrame(data={"foo": ["bar", "baz"]})
+
+    with pytest.raises(ValueError) as e:
+        mutate_data_frame(
+            df,
+            {
+                "foo": [
+                    (-0.5, with_noop()),
+                    (1.5, with_missing_value()),
+                ],
+            },
+        )
+
+    assert str(e.value) == "probabilities for column `foo` must sum up to 1.0"
+
+
 def test_mutate_data_frame_pad_probability():
     df_in = pd.DataFrame(data={"foo": ["a"] * 100})
     df_out = mutate_data_frame(
@@ -463,63 +731,79 @@ def test_mutate_data_frame_multicolumn_noop():
     assert (df_out["bar"] == "a").any()
 
 
+def _hash_rows(obj) -> np.ndarray:
+    # hashes are compared row by row since a sum of hashes doesn't detect rows that swapped places
+    return pd.util.hash_pandas_object(obj, index=True).to_numpy()
+
+
 # dummy rng (shouldn't be used for testing mutator outputs)
 __dummy_rng = np.random.default_rng(5432)
 
 
-@pytest.mark.parametrize(
-    "num_srs,func",
-    [
-        (1, with_noop()),
-        (1, with_missing_value("", "all")),
-        (1, with_missing_value("", "blank")),
-        (1, with_missing_value("", "empty")),
-        (1, with_function(lambda s: s.upper())),
-        (1, with_insert(rng=__dummy_rng)),
-        (1, with_delete(rng=__dummy_rng)),
-        (1, with_transpose(rng=__dummy_rng)),
-        (1, with_substitute(rng=__dummy_rng)),
-        (1, with_edit(rng=__dummy_rng)),
-        (
-            1,
-            with_categorical_values(
-                get_asset_path("freq_table_gender.csv"),
-                value_column="gender",
-                rng=__dummy_rng,
-            ),
+# mutators and the amount of series they take. built once and shared by all tests that run on every mutator.
+# each one has an explicit id so that test ids are readable and stable, e.g. when tests are distributed across workers.
+_mutators_with_srs_count = [
+    pytest.param(1, with_noop(), id="noop"),
+    pytest.param(1, with_missing_value("", "all"), id="missing_value_all"),
+    pytest.param(1, with_missing_value("", "blank"), id="missing_value_blank"),
+    pytest.param(1, with_missing_value("", "empty"), id="missing_value_empty"),
+    # with_function passes missing values on to the function as-is
+    pytest.param(
+        1,
+        with_function(lambda s: s.upper() if isinstance(s, str) else s),
+        id="function",
+    ),
+    pytest.param(
+        1,
+        with_vectorized_function(lambda srs: srs.str.upper()),
+        id="vectorized_function",
+    ),
+    pytest.param(1, with_insert(rng=__dummy_rng), id="insert"),
+    pytest.param(1, with_delete(rng=__dummy_rng), id="delete"),
+    pytest.param(1, with_transpose(rng=__dummy_rng), id="transpose"),
+    pytest.param(1, with_substitute(rng=__dummy_rng), id="substitute"),
+    pytest.param(1, with_edit(rng=__dummy_rng), id="edit"),
+    pytest.param(
+        1,
+        with_categorical_values(
+            get_asset_path("freq_table_gender.csv"),
+            value_column="gender",
+            rng=__dummy_rng,
         ),
-        (
-            1,
-            with_phonetic_replacement_table(
-                get_asset_path("homophone-de.csv"), rng=__dummy_rng
-            ),
+        id="categorical_values",
+    ),
+    pytest.param(
+        1,
+        with_phonetic_replacement_table(
+            get_asset_path("homophone-de.csv"), rng=__dummy_rng
         ),
-        (
-            1,
-            with_cldr_keymap_file(
-                get_asset_path("de-t-k0-windows.xml"), rng=__dummy_rng
-            ),
-        ),
-        (1, with_replacement_table(get_asset_path("ocr.csv"), rng=__dummy_rng)),
-        (2, with_permute()),
-    ],
-)
-def test_mutator_no_modify(num_srs: int, func: Mutator, rng):
+        id="phonetic_replacement_table",
+    ),
+    pytest.param(
+        1,
+        with_cldr_keymap_file(get_asset_path("de-t-k0-windows.xml"), rng=__dummy_rng),
+        id="cldr_keymap_file",
+    ),
+    pytest.param(
+        1,
+        with_replacement_table(get_asset_path("ocr.csv"), rng=__dummy_rng),
+        id="replacement_table",
+    ),
+    pytest.param(2, with_permute(), id="permute"),
+]
+
+
+@pytest.mark.parametrize("num_srs,func", _mutators_with_srs_count)
+def test_mutator_no_modify(num_srs: int, func: Mutator, random_str_series):
     # ensure that the original series are NEVER modified in the mutators
-    def __random_str():
-        return "".join(rng.choice(list(string.printable), size=20))
-
-    # create random series and a copy of it
-    srs_list_orig = [
-        pd.Series([__random_str() for _ in range(100)]) for _ in range(num_srs)
-    ]
-
-    srs_list_copy = [srs.copy() for srs in srs_list_orig]
+    # create random series and hash their rows instead of keeping a full copy
+    srs_list_orig = [random_str_series(100) for _ in range(num_srs)]
+    arr_hash_list = [_hash_rows(srs) for srs in srs_list_orig]
 
     _ = func(srs_list_orig)
 
-    for i in range(num_srs):
-        assert (srs_list_orig[i] == srs_list_copy[i]).all()
+    for srs_orig, arr_hash in zip(srs_list_orig, arr_hash_list):
+        assert np.array_equal(_hash_rows(srs_orig), arr_hash)
 
 
 def test_mutate_data_frame_no_modify(rng):
@@ -530,7 +814,7 @@ def test_mutate_data_frame_no_modify(rng):
         }
     )
 
-    df_copy = df_orig.copy()
+    arr_hash = _hash_rows(df_orig)
 
     _ = mutate_data_frame(
         df_orig,
@@ -540,52 +824,49 @@ def test_mutate_data_frame_no_modify(rng):
         },
     )
 
-    assert df_orig.equals(df_copy)
+    assert np.array_equal(_hash_rows(df_orig), arr_hash)
 
 
 # see https://github.com/ul-mds/gecko/issues/33
 # this is to test that none of the mutators fail if they are provided an empty series
-@pytest.mark.parametrize(
-    "num_srs,func",
-    [
-        (1, with_noop()),
-        (1, with_missing_value("", "all")),
-        (1, with_missing_value("", "blank")),
-        (1, with_missing_value("", "empty")),
-        (1, with_function(lambda s: s.upper())),
-        (1, with_insert(rng=__dummy_rng)),
-        (1, with_delete(rng=__dummy_rng)),
-        (1, with_transpose(rng=__dummy_rng)),
-        (1, with_substitute(rng=__dummy_rng)),
-        (1, with_edit(rng=__dummy_rng)),
-        (
-            1,
-            with_categorical_values(
-                get_asset_path("freq_table_gender.csv"),
-                value_column="gender",
-                rng=__dummy_rng,
-            ),
-        ),
-        (
-            1,
-            with_phonetic_replacement_table(
-                get_asset_path("homophone-de.csv"), rng=__dummy_rng
-            ),
-        ),
-        (
-            1,
-            with_cldr_keymap_file(
-                get_asset_path("de-t-k0-windows.xml"), rng=__dummy_rng
-            ),
-        ),
-        (1, with_replacement_table(get_asset_path("ocr.csv"), rng=__dummy_rng)),
-        (2, with_permute()),
-    ],
-)
+@pytest.mark.parametrize("num_srs,func", _mutators_with_srs_count)
 def test_no_error_on_empty_series(num_srs: int, func: Mutator):
     func([pd.Series() for _ in range(num_srs)])
 
 
+# mutators that leave missing values untouched. replacing all values with a missing value replaces missing
+# values as well and always produces a series of objects, see test_with_value_replace_all.
+_mutators_keeping_missing_values = [
+    p for p in _mutators_with_srs_count if p.id != "missing_value_all"
+]
+
+
+# mutators should also accept series that are backed by pandas' string dtypes
+@pytest.mark.parametrize("dtype", ["string[python]", "string[pyarrow]"])
+@pytest.mark.parametrize("num_srs,func", _mutators_keeping_missing_values)
+def test_string_dtype_input(num_srs: int, func: Mutator, dtype: str, random_str_series):
+    if dtype == "string[pyarrow]":
+        pytest.importorskip("pyarrow")
+
+    srs_list = []
+
+    for _ in range(num_srs):
+        srs = random_str_series(100).astype(dtype)
+        # non-default index to check that it is carried over, and every tenth value is missing
+        srs.index = srs.index * 2 + 1
+        srs.iloc[::10] = pd.NA
+        srs_list.append(srs)
+
+    srs_list_mutated = func(srs_list)
+
+    assert len(srs_list_mutated) == num_srs
+
+    for srs, srs_mutated in zip(srs_list, srs_list_mutated):
+        assert srs_mutated.dtype == srs.dtype
+        assert srs_mutated.index.equals(srs.index)
+        assert srs_mutated.isna().equals(srs.isna())
+
+
 def test_multiple_mutators_per_column(rng):
     df_in = pd.DataFrame(
         {
@@ -605,6 +886,29 @@ def test_multiple_mutators_per_column(rng):
     assert (df_out["bar"] == "").all()
 
 
+def test_mutate_data_frame_no_modify_partial(rng):
+    df_orig = pd.DataFrame(
+        {
+            "upper": list(string.ascii_uppercase),
+            "lower": list(string.ascii_lowercase),
+        }
+    )
+
+    arr_hash = _hash_rows(df_orig)
+
+    # only one column is mutated, the other one is shared with the input data frame
+    df_mutated = mutate_data_frame(
+        df_orig,
+        {
+            "upper": with_delete(rng=rng),
+        },
+    )
+
+    assert np.array_equal(_hash_rows(df_orig), arr_hash)
+    assert df_mutated["lower"].equals(df_orig["lower"])
+    assert (df_mutated["upper"] != df_orig["upper"]).all()
+
+
 # see https://github.com/ul-mds/gecko/issues/41
 @pytest.mark.parametrize(
     "value,value_type",